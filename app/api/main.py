@@ -14,7 +14,7 @@ import logging
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api import __version__
 from app.api.models.responses import HealthResponse, ErrorResponse
@@ -85,6 +85,7 @@ app = FastAPI(
     """,
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -104,7 +105,7 @@ app.add_middleware(
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
     """Handle validation errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content=ErrorResponse(
             error="ValidationError",
@@ -117,7 +118,7 @@ async def value_error_handler(request: Request, exc: ValueError):
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected errors."""
     logger.exception("Unexpected error")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=ErrorResponse(
             error="InternalError",
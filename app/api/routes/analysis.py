@@ -4,14 +4,17 @@ Analysis routes for vegetation change detection API.
 Endpoints:
 - POST /analysis - Create analysis job
 - GET /analysis/{job_id} - Get job status/results
+- GET /analysis/{job_id}/statistics - Stream job statistics
 - DELETE /analysis/{job_id} - Cancel job
 - GET /analysis - List jobs
 - POST /analysis/preview - Generate preview tile URL
 """
 
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi.responses import StreamingResponse
 import ee
+import orjson
 
 from app.api.models.requests import (
     AnalysisRequest,
@@ -140,6 +143,51 @@ async def get_job_status(job_id: str):
     )
 
 
+def stream_statistics(statistics: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    Encode ``{"statistics": ...}`` one comparison at a time.
+
+    Only one comparison's encoded statistics are held in memory at once,
+    instead of the whole serialized payload.
+    """
+    yield b'{"statistics":{'
+    separator = b""
+    for name, stats in statistics.items():
+        yield separator + orjson.dumps(name) + b":" + orjson.dumps(stats)
+        separator = b","
+    yield b"}}"
+
+
+@router.get(
+    "/{job_id}/statistics",
+    responses={
+        200: {"content": {"application/json": {}}, "description": "Job statistics"},
+        404: {"model": ErrorResponse, "description": "Job not found"},
+        409: {"model": ErrorResponse, "description": "Job has no results yet"},
+    },
+    summary="Get job statistics",
+    description="Stream the change statistics of a completed analysis job.",
+)
+async def get_job_statistics(job_id: str):
+    """Stream statistics of a completed analysis job."""
+    orchestrator = get_orchestrator()
+    job = orchestrator.get_job(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    if not job.results:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job has no results (status: {job.status.value})"
+        )
+
+    return StreamingResponse(
+        stream_statistics(job.results.get("statistics") or {}),
+        media_type="application/json",
+    )
+
+
 @router.delete(
     "/{job_id}",
     responses={
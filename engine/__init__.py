@@ -36,6 +36,7 @@ from engine.config import (
 from engine.ee_init import (
     initialize_ee,
     is_ee_initialized,
+    has_persistent_credentials,
     get_ee_status,
     authenticate_ee,
     init_ee_streamlit,
@@ -72,6 +73,7 @@ __all__ = [
     # EE Init
     "initialize_ee",
     "is_ee_initialized",
+    "has_persistent_credentials",
     "get_ee_status",
     "authenticate_ee",
     "init_ee_streamlit",
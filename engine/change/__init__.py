@@ -16,12 +16,15 @@ from engine.change.thresholds import (
 from engine.change.detection import (
     classify_change,
     analyze_period_change,
+    analyze_period_change_multi,
     create_change_analysis,
     create_sequential_change,
 )
 
 from engine.change.statistics import (
     generate_change_statistics,
+    generate_batched_change_statistics,
+    summarize_class_histogram,
     calculate_area_by_class,
     get_class_info,
     summarize_change,
@@ -35,10 +38,13 @@ __all__ = [
     # Detection functions
     "classify_change",
     "analyze_period_change",
+    "analyze_period_change_multi",
     "create_change_analysis",
     "create_sequential_change",
     # Statistics functions
     "generate_change_statistics",
+    "generate_batched_change_statistics",
+    "summarize_class_histogram",
     "calculate_area_by_class",
     "get_class_info",
     "summarize_change",
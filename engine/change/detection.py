@@ -66,6 +66,40 @@ def analyze_period_change(
     return delta.addBands(classified)
 
 
+def analyze_period_change_multi(
+    before: ee.Image,
+    after: ee.Image,
+    index_names: List[str],
+    thresholds: Optional[ChangeThresholds] = None,
+) -> ee.Image:
+    """
+    Analyze change between two time periods for several indices at once.
+
+    Selects and subtracts all index bands in one step, then classifies
+    each delta band. Band layout matches concatenating
+    ``analyze_period_change`` per index: ``d<index>, change_class`` pairs.
+
+    Args:
+        before: Earlier period composite with index bands
+        after: Later period composite with index bands
+        index_names: Names of the indices to analyze
+        thresholds: Custom thresholds (default: per index from config)
+
+    Returns:
+        ee.Image with delta and change_class bands for every index
+    """
+    delta_names = [f"d{name}" for name in index_names]
+    deltas = after.select(index_names).subtract(before.select(index_names)).rename(delta_names)
+
+    bands = []
+    for delta_name in delta_names:
+        delta = deltas.select(delta_name)
+        bands.append(delta)
+        bands.append(classify_change(delta, thresholds, delta_name))
+
+    return ee.Image.cat(bands)
+
+
 def create_change_analysis(
     composites: Dict[str, ee.Image],
     indices: Optional[List[str]] = None,
@@ -98,16 +132,8 @@ def create_change_analysis(
         if period_name == reference_period:
             continue
 
-        period_changes = []
-
-        for index_name in indices:
-            change = analyze_period_change(baseline, composite, index_name)
-            period_changes.append(change)
-
-        # Combine all index changes
-        combined = period_changes[0]
-        for change_img in period_changes[1:]:
-            combined = combined.addBands(change_img)
+        # All index deltas in one subtraction
+        combined = analyze_period_change_multi(baseline, composite, indices)
 
         # Set metadata
         combined = combined.set({
@@ -7,6 +7,7 @@ from change classification results.
 
 from typing import Dict, List
 import ee
+import numpy as np
 
 from engine.config import CHANGE_CLASSES
 
@@ -41,6 +42,95 @@ def generate_change_statistics(
     return histogram
 
 
+def generate_batched_change_statistics(
+    change_images: Dict[str, ee.Image],
+    aoi: ee.Geometry,
+    scale: int = 30,
+) -> Dict[str, ee.Dictionary]:
+    """
+    Generate statistics for several change classifications in one reduction.
+
+    The change_class band of every image is stacked into one multi-band
+    image (one band per comparison) and reduced with a single
+    reduceRegion, so evaluating the statistics costs one server
+    computation instead of one per comparison.
+
+    Args:
+        change_images: Dictionary mapping comparison names to images
+            with a change_class band
+        aoi: Area of interest
+        scale: Analysis scale in meters
+
+    Returns:
+        Dictionary mapping comparison names to the same histogram
+        dictionaries generate_change_statistics returns
+    """
+    if not change_images:
+        return {}
+
+    names = list(change_images)
+    stacked = ee.Image.cat([
+        change_images[name].select("change_class").rename(name)
+        for name in names
+    ])
+
+    histograms = ee.Dictionary(stacked.reduceRegion(
+        reducer=ee.Reducer.frequencyHistogram(),
+        geometry=aoi,
+        scale=scale,
+        maxPixels=1e9,
+    ))
+
+    return {
+        name: ee.Dictionary({"change_class": histograms.get(name)})
+        for name in names
+    }
+
+
+def summarize_class_histogram(
+    histogram: Dict[str, float],
+    scale: int = 30,
+    language: str = "en",
+) -> Dict:
+    """
+    Convert an evaluated change_class histogram to areas and percentages.
+
+    Pixel counts are binned by class and converted in one vectorized
+    pass, so the cost does not grow with per-class Python work.
+
+    Args:
+        histogram: Evaluated frequencyHistogram (class value -> pixel count)
+        scale: Analysis scale in meters
+        language: Label language ("en" or "es")
+
+    Returns:
+        Dictionary with total_pixels, total_area_ha, area_by_class and
+        percentage_by_class (keyed by class label)
+    """
+    n_classes = len(CHANGE_CLASSES)
+    classes = np.fromiter(
+        (float(key) for key in histogram), dtype=np.float64, count=len(histogram)
+    ).astype(np.int64)
+    counts = np.fromiter(histogram.values(), dtype=np.float64, count=len(histogram))
+
+    valid = (classes >= 1) & (classes <= n_classes)
+    counts = np.bincount(classes[valid] - 1, weights=counts[valid], minlength=n_classes)
+
+    areas = counts * (scale * scale / 10000.0)
+    total_area = areas.sum()
+    percentages = areas * (100.0 / total_area) if total_area else np.zeros_like(areas)
+
+    label_key = "label" if language == "en" else "label_es"
+    labels = [CHANGE_CLASSES[value][label_key] for value in range(1, n_classes + 1)]
+
+    return {
+        "total_pixels": int(counts.sum()),
+        "total_area_ha": total_area.item(),
+        "area_by_class": dict(zip(labels, areas.tolist())),
+        "percentage_by_class": dict(zip(labels, percentages.tolist())),
+    }
+
+
 def calculate_area_by_class(
     change_image: ee.Image,
     aoi: ee.Geometry,
@@ -116,13 +206,22 @@ def summarize_change(
         language: Output language
 
     Returns:
-        List of dictionaries with class info and statistics
+        List of dictionaries with class info plus ``area_ha`` and
+        ``percentage`` per class
     """
-    stats = generate_change_statistics(change_image, aoi, scale)
+    # One grouped reduction, one round trip
+    areas = calculate_area_by_class(change_image, aoi, scale).getInfo() or {}
+    area_by_class = {
+        int(group["class"]): group["sum"] for group in areas.get("groups", [])
+    }
+    total_m2 = sum(area_by_class.values())
 
     summary = []
     for class_value in range(1, 6):
         info = get_class_info(class_value, language)
+        area_m2 = area_by_class.get(class_value, 0)
+        info["area_ha"] = area_m2 / 10000
+        info["percentage"] = area_m2 / total_m2 * 100 if total_m2 else 0.0
         summary.append(info)
 
     return summary
@@ -6,18 +6,20 @@ for change classification.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from abc import ABC, abstractmethod
 import ee
 
 from engine.config import CHANGE_THRESHOLDS
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChangeThresholds:
     """
     Configurable thresholds for change classification.
 
     Implements Dependency Inversion - injectable thresholds.
+    Frozen so instances can be shared and hashed.
     """
     strong_loss: float
     moderate_loss: float
@@ -28,16 +30,22 @@ class ChangeThresholds:
 
     @classmethod
     def from_config(cls, index_name: str) -> "ChangeThresholds":
-        """Create thresholds from default configuration."""
-        config = CHANGE_THRESHOLDS.get(f"d{index_name}", CHANGE_THRESHOLDS["dndvi"])
-        return cls(
-            strong_loss=config["strong_loss"],
-            moderate_loss=config["moderate_loss"],
-            stable_min=config["stable_min"],
-            stable_max=config["stable_max"],
-            moderate_gain=config["moderate_gain"],
-            strong_gain=config["strong_gain"],
-        )
+        """Create thresholds from default configuration (cached per index)."""
+        return _thresholds_for(index_name)
+
+
+@lru_cache(maxsize=32)
+def _thresholds_for(index_name: str) -> ChangeThresholds:
+    """Build the shared, immutable default thresholds for an index."""
+    config = CHANGE_THRESHOLDS.get(f"d{index_name}", CHANGE_THRESHOLDS["dndvi"])
+    return ChangeThresholds(
+        strong_loss=config["strong_loss"],
+        moderate_loss=config["moderate_loss"],
+        stable_min=config["stable_min"],
+        stable_max=config["stable_max"],
+        moderate_gain=config["moderate_gain"],
+        strong_gain=config["strong_gain"],
+    )
 
 
 class ChangeClassifier(ABC):
@@ -76,21 +84,18 @@ class ThresholdClassifier(ChangeClassifier):
         """
         t = self.thresholds
 
-        # Start with class 3 (stable)
-        classified = ee.Image.constant(3)
-
-        # Apply thresholds in order
-        classified = classified.where(
-            delta_image.lte(t.strong_loss), 1  # Strong loss
-        )
-        classified = classified.where(
-            delta_image.gt(t.strong_loss).And(delta_image.lte(t.moderate_loss)), 2  # Moderate loss
-        )
-        classified = classified.where(
-            delta_image.gte(t.moderate_gain).And(delta_image.lt(t.strong_gain)), 4  # Moderate gain
-        )
-        classified = classified.where(
-            delta_image.gte(t.strong_gain), 5  # Strong gain
+        # One expression node instead of a constant seed plus four chained
+        # where() calls; EE evaluates it in a single per-pixel pass.
+        # Thresholds are ordered, so each boundary crossed shifts the class
+        # by one from stable (3): four comparisons, no branching.
+        classified = delta_image.expression(
+            "3 - (b(0) <= SL) - (b(0) <= ML) + (b(0) >= MG) + (b(0) >= SG)",
+            {
+                "SL": t.strong_loss,
+                "ML": t.moderate_loss,
+                "MG": t.moderate_gain,
+                "SG": t.strong_gain,
+            },
         )
 
         return classified.rename("change_class").toUint8()
@@ -22,7 +22,8 @@ def scale_landsat(image: ee.Image, sensor: str) -> ee.Image:
         sensor: Sensor identifier string
 
     Returns:
-        Scaled ee.Image with reflectance values [0, 1]
+        Scaled ee.Image with only the optical (SR_B*) bands, reflectance
+        values [0, 1]. QA bands are dropped, so apply the cloud mask first.
     """
     band_config = get_band_mapping(sensor)
     scale = band_config["scale_factor"]
@@ -37,8 +38,8 @@ def scale_landsat(image: ee.Image, sensor: str) -> ee.Image:
     # Clip to valid range
     scaled = scaled.clamp(0, 1)
 
-    # Copy over other bands and properties
-    return image.addBands(scaled, overwrite=True)
+    # Keep only the scaled bands; carry the acquisition time over
+    return ee.Image(scaled.copyProperties(image, ["system:time_start"]))
 
 
 def scale_sentinel(image: ee.Image) -> ee.Image:
@@ -49,7 +50,8 @@ def scale_sentinel(image: ee.Image) -> ee.Image:
         image: Sentinel-2 ee.Image
 
     Returns:
-        Scaled ee.Image with reflectance values [0, 1]
+        Scaled ee.Image with only the optical (B*) bands, reflectance
+        values [0, 1]. QA60 is dropped, so apply the cloud mask first.
     """
     band_config = get_band_mapping("COPERNICUS/S2_SR_HARMONIZED")
     scale = band_config["scale_factor"]
@@ -63,7 +65,8 @@ def scale_sentinel(image: ee.Image) -> ee.Image:
     # Clip to valid range
     scaled = scaled.clamp(0, 1)
 
-    return image.addBands(scaled, overwrite=True)
+    # Keep only the scaled bands; carry the acquisition time over
+    return ee.Image(scaled.copyProperties(image, ["system:time_start"]))
 
 
 def harmonize_bands(image: ee.Image, sensor: str) -> ee.Image:
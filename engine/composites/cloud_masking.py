@@ -35,14 +35,9 @@ def apply_cloud_mask_landsat(image: ee.Image) -> ee.Image:
     dilated_bit = CLOUD_MASK_CONFIG["landsat"]["dilated_cloud_bit"]
     snow_bit = CLOUD_MASK_CONFIG["landsat"]["snow_bit"]
 
-    # Create masks for each condition
-    cloud_mask = qa.bitwiseAnd(1 << cloud_bit).eq(0)
-    shadow_mask = qa.bitwiseAnd(1 << shadow_bit).eq(0)
-    dilated_mask = qa.bitwiseAnd(1 << dilated_bit).eq(0)
-    snow_mask = qa.bitwiseAnd(1 << snow_bit).eq(0)
-
-    # Combine all masks
-    mask = cloud_mask.And(shadow_mask).And(dilated_mask).And(snow_mask)
+    # Clear pixels have none of the flagged bits set: one AND + compare
+    mask_bits = (1 << cloud_bit) | (1 << shadow_bit) | (1 << dilated_bit) | (1 << snow_bit)
+    mask = qa.bitwiseAnd(mask_bits).eq(0)
 
     return image.updateMask(mask)
 
@@ -67,11 +62,8 @@ def apply_cloud_mask_sentinel(image: ee.Image) -> ee.Image:
     cloud_bit = CLOUD_MASK_CONFIG["sentinel2"]["cloud_bit"]
     cirrus_bit = CLOUD_MASK_CONFIG["sentinel2"]["cirrus_bit"]
 
-    # Create masks
-    cloud_mask = qa.bitwiseAnd(1 << cloud_bit).eq(0)
-    cirrus_mask = qa.bitwiseAnd(1 << cirrus_bit).eq(0)
-
-    # Combine masks
-    mask = cloud_mask.And(cirrus_mask)
+    # Clear pixels have neither flag set
+    mask_bits = (1 << cloud_bit) | (1 << cirrus_bit)
+    mask = qa.bitwiseAnd(mask_bits).eq(0)
 
     return image.updateMask(mask)
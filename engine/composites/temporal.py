@@ -7,7 +7,9 @@ Provides functions to create cloud-free median composites from:
 - Multi-sensor fusion
 """
 
-from typing import Dict, List, Optional
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterator, List, Optional
 import ee
 
 from engine.config import TEMPORAL_PERIODS, get_period_info
@@ -22,6 +24,43 @@ from engine.composites.band_harmonization import (
 )
 
 
+@lru_cache(maxsize=None)
+def _landsat_preprocessor(sensor: str) -> Callable[[ee.Image], ee.Image]:
+    """Per-image mask, scale and harmonize function for a Landsat sensor."""
+    def preprocess(image: ee.Image) -> ee.Image:
+        masked = apply_cloud_mask_landsat(image)
+        scaled = scale_landsat(masked, sensor)
+        return harmonize_bands(scaled, sensor)
+
+    return preprocess
+
+
+@lru_cache(maxsize=None)
+def _sentinel_preprocessor(sensor: str) -> Callable[[ee.Image], ee.Image]:
+    """Per-image mask, scale and harmonize function for Sentinel-2."""
+    def preprocess(image: ee.Image) -> ee.Image:
+        masked = apply_cloud_mask_sentinel(image)
+        scaled = scale_sentinel(masked)
+        return harmonize_bands(scaled, sensor)
+
+    return preprocess
+
+
+def _scene_filter(
+    aoi: ee.Geometry,
+    start_date: str,
+    end_date: str,
+    cloud_property: str,
+    cloud_threshold: float,
+) -> ee.Filter:
+    """Combine the bounds, date and cloud-cover filters into one ee.Filter."""
+    return ee.Filter.And(
+        ee.Filter.bounds(aoi),
+        ee.Filter.date(start_date, end_date),
+        ee.Filter.lt(cloud_property, cloud_threshold),
+    )
+
+
 def create_landsat_composite(
     aoi: ee.Geometry,
     start_date: str,
@@ -43,21 +82,12 @@ def create_landsat_composite(
         Median composite ee.Image with harmonized bands
     """
     # Load and filter collection
-    collection = (
-        ee.ImageCollection(sensor)
-        .filterBounds(aoi)
-        .filterDate(start_date, end_date)
-        .filter(ee.Filter.lt("CLOUD_COVER", cloud_threshold))
+    collection = ee.ImageCollection(sensor).filter(
+        _scene_filter(aoi, start_date, end_date, "CLOUD_COVER", cloud_threshold)
     )
 
     # Apply cloud mask and scaling
-    def preprocess(image):
-        masked = apply_cloud_mask_landsat(image)
-        scaled = scale_landsat(masked, sensor)
-        harmonized = harmonize_bands(scaled, sensor)
-        return harmonized
-
-    processed = collection.map(preprocess)
+    processed = collection.map(_landsat_preprocessor(sensor))
 
     # Create median composite
     composite = processed.median().clip(aoi)
@@ -94,21 +124,12 @@ def create_sentinel_composite(
     sensor = "COPERNICUS/S2_SR_HARMONIZED"
 
     # Load and filter collection
-    collection = (
-        ee.ImageCollection(sensor)
-        .filterBounds(aoi)
-        .filterDate(start_date, end_date)
-        .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", cloud_threshold))
+    collection = ee.ImageCollection(sensor).filter(
+        _scene_filter(aoi, start_date, end_date, "CLOUDY_PIXEL_PERCENTAGE", cloud_threshold)
     )
 
     # Apply cloud mask and scaling
-    def preprocess(image):
-        masked = apply_cloud_mask_sentinel(image)
-        scaled = scale_sentinel(masked)
-        harmonized = harmonize_bands(scaled, sensor)
-        return harmonized
-
-    processed = collection.map(preprocess)
+    processed = collection.map(_sentinel_preprocessor(sensor))
 
     # Create median composite
     composite = processed.median().clip(aoi)
@@ -147,48 +168,32 @@ def create_fused_composite(
     Returns:
         Fused median composite ee.Image
     """
-    merged_collection = None
+    processed_collections = []
 
     for sensor in sensors:
         if "S2" in sensor or "COPERNICUS" in sensor:
             # Sentinel-2
-            collection = (
-                ee.ImageCollection(sensor)
-                .filterBounds(aoi)
-                .filterDate(start_date, end_date)
-                .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", cloud_threshold))
+            collection = ee.ImageCollection(sensor).filter(
+                _scene_filter(aoi, start_date, end_date, "CLOUDY_PIXEL_PERCENTAGE", cloud_threshold)
             )
-
-            def preprocess_s2(image):
-                masked = apply_cloud_mask_sentinel(image)
-                scaled = scale_sentinel(masked)
-                return harmonize_bands(scaled, sensor)
-
-            processed = collection.map(preprocess_s2)
+            processed = collection.map(_sentinel_preprocessor(sensor))
 
         else:
             # Landsat
-            collection = (
-                ee.ImageCollection(sensor)
-                .filterBounds(aoi)
-                .filterDate(start_date, end_date)
-                .filter(ee.Filter.lt("CLOUD_COVER", cloud_threshold))
+            collection = ee.ImageCollection(sensor).filter(
+                _scene_filter(aoi, start_date, end_date, "CLOUD_COVER", cloud_threshold)
             )
+            processed = collection.map(_landsat_preprocessor(sensor))
 
-            def make_preprocess_landsat(s):
-                def preprocess_ls(image):
-                    masked = apply_cloud_mask_landsat(image)
-                    scaled = scale_landsat(masked, s)
-                    return harmonize_bands(scaled, s)
-                return preprocess_ls
-
-            processed = collection.map(make_preprocess_landsat(sensor))
+        processed_collections.append(processed)
 
-        # Merge collections
-        if merged_collection is None:
-            merged_collection = processed
-        else:
-            merged_collection = merged_collection.merge(processed)
+    # Merge all sensors in one flatten node rather than a chain of merge()s
+    if len(processed_collections) == 1:
+        merged_collection = processed_collections[0]
+    else:
+        merged_collection = ee.ImageCollection(
+            ee.FeatureCollection(processed_collections).flatten()
+        )
 
     # Create median composite from merged collection
     composite = merged_collection.median().clip(aoi)
@@ -203,11 +208,57 @@ def create_fused_composite(
     return composite
 
 
+class _LazyComposites(Mapping):
+    """
+    Read-only mapping of period composites built on first access.
+
+    Keys are known up front; a period's ``ee.Image`` graph is only
+    assembled when it is first read, then memoized.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], ee.Image]]):
+        self._factories = dict(factories)
+        self._built: Dict[str, ee.Image] = {}
+
+    def __getitem__(self, key: str) -> ee.Image:
+        if key not in self._built:
+            self._built[key] = self._factories[key]()
+        return self._built[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._factories)})"
+
+
+def _period_composite(
+    aoi: ee.Geometry,
+    period_name: str,
+    period_info: Dict,
+    cloud_threshold: float,
+) -> ee.Image:
+    """Build one period's fused composite tagged with its period name."""
+    composite = create_fused_composite(
+        aoi=aoi,
+        start_date=period_info["start"],
+        end_date=period_info["end"],
+        sensors=period_info["sensors"],
+        cloud_threshold=cloud_threshold,
+    )
+
+    # Add period name to metadata
+    return composite.set("period", period_name)
+
+
 def create_all_period_composites(
     aoi: ee.Geometry,
     periods: Optional[List[str]] = None,
     cloud_threshold: float = 20.0,
-) -> Dict[str, ee.Image]:
+) -> Mapping[str, ee.Image]:
     """
     Create composites for all specified temporal periods.
 
@@ -217,29 +268,19 @@ def create_all_period_composites(
         cloud_threshold: Maximum cloud cover percentage
 
     Returns:
-        Dictionary mapping period names to composite images
+        Read-only mapping of period names to composite images. Composites
+        are built lazily on first access; unknown periods still raise
+        immediately. Use ``dict(result)`` for a mutable copy.
     """
     if periods is None:
         periods = list(TEMPORAL_PERIODS.keys())
 
-    composites = {}
-
-    for period_name in periods:
-        period_info = get_period_info(period_name)
-
-        composite = create_fused_composite(
-            aoi=aoi,
-            start_date=period_info["start"],
-            end_date=period_info["end"],
-            sensors=period_info["sensors"],
-            cloud_threshold=cloud_threshold,
+    return _LazyComposites({
+        period_name: partial(
+            _period_composite, aoi, period_name, get_period_info(period_name), cloud_threshold
         )
-
-        # Add period name to metadata
-        composite = composite.set("period", period_name)
-        composites[period_name] = composite
-
-    return composites
+        for period_name in periods
+    })
 
 
 def get_image_count(
@@ -267,12 +308,8 @@ def get_image_count(
     else:
         cloud_property = "CLOUD_COVER"
 
-    count = (
-        ee.ImageCollection(sensor)
-        .filterBounds(aoi)
-        .filterDate(start_date, end_date)
-        .filter(ee.Filter.lt(cloud_property, cloud_threshold))
-        .size()
-    )
+    count = ee.ImageCollection(sensor).filter(
+        _scene_filter(aoi, start_date, end_date, cloud_property, cloud_threshold)
+    ).size()
 
     return count
@@ -6,8 +6,10 @@ parameters, and change detection thresholds.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+import sys
 import yaml
 
 
@@ -238,9 +240,15 @@ CHANGE_CLASSES = {
 # SITE CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class VegChangeConfig:
-    """Configuration for vegetation change analysis."""
+    """
+    Configuration for vegetation change analysis.
+
+    Instances are immutable and hashable; list fields are excluded from the
+    hash. Short string fields are interned so configs sharing a site,
+    region or country share storage and compare by identity first.
+    """
 
     # Site identification
     site_name: str = "Analysis Site"
@@ -249,7 +257,10 @@ class VegChangeConfig:
     country: str = "Country"
 
     # Analysis periods
-    periods: List[str] = field(default_factory=lambda: ["1990s", "2000s", "2010s", "present"])
+    periods: List[str] = field(
+        default_factory=lambda: ["1990s", "2000s", "2010s", "present"],
+        hash=False,
+    )
 
     # Spatial parameters
     buffer_distance: float = 500.0  # meters around AOI
@@ -260,7 +271,7 @@ class VegChangeConfig:
     min_images: int = 5  # Minimum images for composite
 
     # Spectral indices to calculate
-    indices: List[str] = field(default_factory=lambda: ["ndvi", "nbr"])
+    indices: List[str] = field(default_factory=lambda: ["ndvi", "nbr"], hash=False)
 
     # Output configuration
     output_dir: str = "outputs"
@@ -270,6 +281,13 @@ class VegChangeConfig:
     # CRS
     target_epsg: int = 4326  # WGS84 for GEE
 
+    def __post_init__(self):
+        """Intern short string fields (frozen, so bypass __setattr__)."""
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+
     @classmethod
     def from_yaml(cls, yaml_path: str) -> "VegChangeConfig":
         """Load configuration from YAML file."""
@@ -299,6 +317,9 @@ class VegChangeConfig:
             yaml.dump(data, f, default_flow_style=False)
 
 
+_INTERNED_FIELDS = ("site_name", "region", "country", "output_dir", "drive_folder")
+
+
 # Default configuration
 DEFAULT_CONFIG = VegChangeConfig()
 
@@ -310,15 +331,17 @@ def get_config(yaml_path: Optional[str] = None) -> VegChangeConfig:
     return DEFAULT_CONFIG
 
 
+@lru_cache(maxsize=None)
 def get_period_info(period_name: str) -> Dict:
-    """Get information for a temporal period."""
+    """Get information for a temporal period (memoized per name)."""
     if period_name not in TEMPORAL_PERIODS:
         raise ValueError(f"Unknown period: {period_name}. Valid: {list(TEMPORAL_PERIODS.keys())}")
     return TEMPORAL_PERIODS[period_name]
 
 
+@lru_cache(maxsize=None)
 def get_band_mapping(sensor: str) -> Dict:
-    """Get band mapping for a sensor."""
+    """Get band mapping for a sensor (memoized per sensor)."""
     if sensor not in BAND_MAPPINGS:
         raise ValueError(f"Unknown sensor: {sensor}. Valid: {list(BAND_MAPPINGS.keys())}")
     return BAND_MAPPINGS[sensor]
@@ -12,12 +12,20 @@ This module provides graceful fallbacks and clear error messages.
 
 import os
 import json
-from pathlib import Path
+import time
 from typing import Optional
 from dataclasses import dataclass
 import ee
 
 
+# Endpoint URL indexed by bool(use_high_volume)
+_HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+_OPT_URL = (None, _HIGH_VOLUME_URL)
+
+# Persistent credentials written by `earthengine authenticate`
+_CREDS_PATH = os.path.join(os.path.expanduser("~"), ".config", "earthengine", "credentials")
+
+
 @dataclass
 class EECredentials:
     """Earth Engine credentials configuration."""
@@ -49,6 +57,8 @@ class EEInitializer:
         self._initialized = False
         self._project = None
         self._method = None
+        self._chosen_strategy = None
+        self._last_test = (0.0, None)
 
     @property
     def is_initialized(self) -> bool:
@@ -92,23 +102,34 @@ class EEInitializer:
         if self._initialized and not force:
             return True
 
+        self._last_test = (0.0, None)
+
         # Try service account first if provided
         if service_account and private_key_file:
             return self._init_service_account(
                 service_account, private_key_file, project, use_high_volume
             )
 
-        # Try persistent credentials
+        # Reuse the strategy that succeeded before (skips the credentials lookup)
+        if self._chosen_strategy is not None:
+            try:
+                return self._chosen_strategy(project, use_high_volume)
+            except EEAuthenticationError:
+                self._chosen_strategy = None
+
+        # Try persistent credentials, otherwise need to authenticate
         if self._has_persistent_credentials():
-            return self._init_persistent(project, use_high_volume)
+            strategy = self._init_persistent
+        else:
+            strategy = self._init_interactive
 
-        # Need to authenticate
-        return self._init_interactive(project, use_high_volume)
+        result = strategy(project, use_high_volume)
+        self._chosen_strategy = strategy
+        return result
 
     def _has_persistent_credentials(self) -> bool:
         """Check if persistent credentials exist."""
-        credentials_path = Path.home() / ".config" / "earthengine" / "credentials"
-        return credentials_path.exists()
+        return os.path.exists(_CREDS_PATH)
 
     def _init_persistent(
         self,
@@ -117,10 +138,7 @@ class EEInitializer:
     ) -> bool:
         """Initialize using persistent credentials."""
         try:
-            opt_url = (
-                "https://earthengine-highvolume.googleapis.com"
-                if use_high_volume else None
-            )
+            opt_url = _OPT_URL[bool(use_high_volume)]
 
             if project:
                 ee.Initialize(project=project, opt_url=opt_url)
@@ -163,10 +181,7 @@ class EEInitializer:
                 private_key_file
             )
 
-            opt_url = (
-                "https://earthengine-highvolume.googleapis.com"
-                if use_high_volume else None
-            )
+            opt_url = _OPT_URL[bool(use_high_volume)]
 
             ee.Initialize(credentials, project=project, opt_url=opt_url)
 
@@ -208,9 +223,8 @@ class EEInitializer:
         """Try to detect the current project."""
         try:
             # Try to get project from credentials file
-            credentials_path = Path.home() / ".config" / "earthengine" / "credentials"
-            if credentials_path.exists():
-                with open(credentials_path, "r") as f:
+            if os.path.exists(_CREDS_PATH):
+                with open(_CREDS_PATH, "r") as f:
                     creds = json.load(f)
                     return creds.get("project_id")
         except Exception:
@@ -233,10 +247,16 @@ class EEInitializer:
         except Exception as e:
             raise EEAuthenticationError(f"Authentication failed: {e}")
 
-    def test_connection(self) -> dict:
+    def test_connection(self, ttl: float = 5.0) -> dict:
         """
         Test Earth Engine connection and return status.
 
+        A successful result is reused for ``ttl`` seconds so that repeated
+        status polling (e.g. Streamlit reruns) does not hit the network.
+
+        Args:
+            ttl: Seconds to reuse the last successful check (0 disables)
+
         Returns:
             Dictionary with connection status and details
         """
@@ -248,15 +268,22 @@ class EEInitializer:
                 "method": None,
             }
 
+        now = time.monotonic()
+        checked_at, cached = self._last_test
+        if cached is not None and now - checked_at < ttl:
+            return cached
+
         try:
             # Simple test - get current date
             result = ee.Date("2024-01-01").getInfo()
-            return {
+            status = {
                 "connected": True,
                 "project": self._project,
                 "method": self._method,
                 "test_result": result,
             }
+            self._last_test = (now, status)
+            return status
         except Exception as e:
             return {
                 "connected": False,
@@ -320,9 +347,14 @@ def is_ee_initialized() -> bool:
     return _initializer.is_initialized
 
 
-def get_ee_status() -> dict:
-    """Get Earth Engine connection status."""
-    return _initializer.test_connection()
+def has_persistent_credentials() -> bool:
+    """Check if credentials from `earthengine authenticate` are available."""
+    return _initializer._has_persistent_credentials()
+
+
+def get_ee_status(ttl: float = 5.0) -> dict:
+    """Get Earth Engine connection status (cached for ``ttl`` seconds)."""
+    return _initializer.test_connection(ttl=ttl)
 
 
 def authenticate_ee(auth_mode: str = "notebook") -> bool:
@@ -30,7 +30,5 @@ class NBRIndex(SpectralIndex):
 
     def calculate(self, image: ee.Image) -> ee.Image:
         """Calculate NBR from harmonized bands."""
-        nir = image.select("nir")
-        swir2 = image.select("swir2")
-        nbr = nir.subtract(swir2).divide(nir.add(swir2)).rename(self.name)
+        nbr = image.normalizedDifference(["nir", "swir2"]).rename(self.name)
         return image.addBands(nbr)
@@ -134,15 +134,11 @@ def calculate_delta_indices(
         delta = calculate_delta_index(before, after, index_name)
         delta_bands.append(delta)
 
-    # Combine all delta bands
+    # Combine all delta bands in a single server-side node
     if len(delta_bands) == 1:
         return delta_bands[0]
 
-    result = delta_bands[0]
-    for band in delta_bands[1:]:
-        result = result.addBands(band)
-
-    return result
+    return ee.Image.cat(delta_bands)
 
 
 def calculate_relative_change(
@@ -33,9 +33,7 @@ class NDVIIndex(SpectralIndex):
 
     def calculate(self, image: ee.Image) -> ee.Image:
         """Calculate NDVI from harmonized bands."""
-        nir = image.select("nir")
-        red = image.select("red")
-        ndvi = nir.subtract(red).divide(nir.add(red)).rename(self.name)
+        ndvi = image.normalizedDifference(["nir", "red"]).rename(self.name)
         return image.addBands(ndvi)
 
 
@@ -58,12 +56,13 @@ class EVIIndex(SpectralIndex):
 
     def calculate(self, image: ee.Image) -> ee.Image:
         """Calculate EVI from harmonized bands."""
-        nir = image.select("nir")
-        red = image.select("red")
-        blue = image.select("blue")
-
-        evi = nir.subtract(red).multiply(2.5).divide(
-            nir.add(red.multiply(6)).subtract(blue.multiply(7.5)).add(1)
+        evi = image.expression(
+            "2.5 * (N - R) / (N + 6 * R - 7.5 * B + 1)",
+            {
+                "N": image.select("nir"),
+                "R": image.select("red"),
+                "B": image.select("blue"),
+            },
         ).rename(self.name)
 
         return image.addBands(evi)
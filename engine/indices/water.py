@@ -30,9 +30,7 @@ class NDWIIndex(SpectralIndex):
 
     def calculate(self, image: ee.Image) -> ee.Image:
         """Calculate NDWI from harmonized bands."""
-        green = image.select("green")
-        nir = image.select("nir")
-        ndwi = green.subtract(nir).divide(green.add(nir)).rename(self.name)
+        ndwi = image.normalizedDifference(["green", "nir"]).rename(self.name)
         return image.addBands(ndwi)
 
 
@@ -55,7 +53,5 @@ class NDMIIndex(SpectralIndex):
 
     def calculate(self, image: ee.Image) -> ee.Image:
         """Calculate NDMI from harmonized bands."""
-        nir = image.select("nir")
-        swir1 = image.select("swir1")
-        ndmi = nir.subtract(swir1).divide(nir.add(swir1)).rename(self.name)
+        ndmi = image.normalizedDifference(["nir", "swir1"]).rename(self.name)
         return image.addBands(ndmi)
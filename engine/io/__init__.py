@@ -12,6 +12,8 @@ from engine.io.aoi import (
     GeoPackageLoader,
     ShapefileLoader,
     GeoJSONLoader,
+    GeoJSONSeqLoader,
+    FlatGeobufLoader,
     KMZLoader,
     KMLLoader,
     LOADER_REGISTRY,
@@ -57,6 +59,8 @@ __all__ = [
     "GeoPackageLoader",
     "ShapefileLoader",
     "GeoJSONLoader",
+    "GeoJSONSeqLoader",
+    "FlatGeobufLoader",
     "KMZLoader",
     "KMLLoader",
     "LOADER_REGISTRY",
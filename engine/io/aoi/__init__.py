@@ -3,9 +3,10 @@ Area of Interest (AOI) loading and processing module.
 
 Supports multiple input formats:
 - KMZ/KML files (Google Earth)
-- GeoJSON
+- GeoJSON (and line-delimited GeoJSONSeq)
 - Shapefile
 - GeoPackage
+- FlatGeobuf
 """
 
 from engine.io.aoi.loaders import (
@@ -13,6 +14,8 @@ from engine.io.aoi.loaders import (
     GeoPackageLoader,
     ShapefileLoader,
     GeoJSONLoader,
+    GeoJSONSeqLoader,
+    FlatGeobufLoader,
     KMZLoader,
     KMLLoader,
     LOADER_REGISTRY,
@@ -38,6 +41,8 @@ __all__ = [
     "GeoPackageLoader",
     "ShapefileLoader",
     "GeoJSONLoader",
+    "GeoJSONSeqLoader",
+    "FlatGeobufLoader",
     "KMZLoader",
     "KMLLoader",
     "LOADER_REGISTRY",
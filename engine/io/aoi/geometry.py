@@ -7,14 +7,105 @@ Provides functions for:
 - Extracting metadata (bounds, centroid, area)
 """
 
-from typing import Dict, Optional
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import os
+import threading
+from typing import Dict, Optional, Tuple
 
 import geopandas as gpd
+import numpy as np
+import shapely
+from pyproj import CRS, Transformer
 from shapely.geometry import mapping
 import ee
 
 
+# CRS objects built once; passing CRS instances lets pyproj reuse transformers
+_WGS84 = CRS.from_epsg(4326)
+_ECK4 = CRS.from_proj4("+proj=eck4")
+
+# Below this many geometries per worker, threading costs more than it saves
+_MIN_PARALLEL_CHUNK = 256
+
+
+@lru_cache(maxsize=None)
+def _utm_crs(zone: int, hemisphere: str) -> CRS:
+    """Get (cached) WGS84 UTM CRS for a zone and hemisphere."""
+    return CRS.from_proj4(f"+proj=utm +zone={zone} +{hemisphere} +datum=WGS84")
+
+
+# pyproj Transformers must not be shared across threads, so each thread
+# keeps its own cache
+_transformer_cache = threading.local()
+_TRANSFORMER_CACHE_SIZE = 64
+
+
+def _utm_transformers(
+    src_crs: CRS, zone: int, hemisphere: str
+) -> Tuple[Transformer, Transformer]:
+    """Get (per-thread cached) forward and inverse transformers between a CRS and UTM."""
+    cache = getattr(_transformer_cache, "utm", None)
+    if cache is None:
+        cache = _transformer_cache.utm = {}
+
+    key = (src_crs, zone, hemisphere)
+    transformers = cache.get(key)
+    if transformers is None:
+        if len(cache) >= _TRANSFORMER_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del cache[next(iter(cache))]
+        utm_crs = _utm_crs(zone, hemisphere)
+        transformers = cache[key] = (
+            Transformer.from_crs(src_crs, utm_crs, always_xy=True),
+            Transformer.from_crs(utm_crs, src_crs, always_xy=True),
+        )
+    return transformers
+
+
+def _transform(geoms: np.ndarray, transformer: Transformer) -> np.ndarray:
+    """Reproject a geometry array with one transformer call over all vertices."""
+    return shapely.transform(
+        geoms, lambda xy: np.column_stack(transformer.transform(xy[:, 0], xy[:, 1]))
+    )
+
+
+def _parallel(func, geoms: np.ndarray, workers: Optional[int] = None) -> np.ndarray:
+    """
+    Apply a vectorized shapely function to a geometry array in threads.
+
+    Shapely 2 releases the GIL inside its vectorized GEOS calls, so chunks
+    of a large array are processed concurrently. Small arrays run inline.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(geoms) // _MIN_PARALLEL_CHUNK)
+    if workers <= 1:
+        return func(geoms)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return np.concatenate(list(executor.map(func, np.array_split(geoms, workers))))
+
+
+def _dissolve(gdf: gpd.GeoDataFrame):
+    """Union all geometries with one GEOS call on the raw geometry array."""
+    return shapely.union_all(np.asarray(gdf.geometry.values))
+
+
+def _replace_geometry(gdf: gpd.GeoDataFrame, geoms) -> gpd.GeoDataFrame:
+    """Return a shallow copy of ``gdf`` with new geometries (attributes shared)."""
+    out = gdf.copy(deep=False)
+    out[gdf.geometry.name] = gpd.GeoSeries(geoms, index=gdf.index, crs=gdf.crs)
+    return out
+
+
+def _to_geojson_dict(gdf: gpd.GeoDataFrame) -> Dict:
+    """Build a GeoJSON FeatureCollection dict from a GeoDataFrame."""
+    try:
+        return gdf._to_geo(na="null", show_bbox=False)
+    except (AttributeError, TypeError):
+        # Private helper unavailable: use the public geo interface
+        return gdf.__geo_interface__
+
+
 def geodataframe_to_ee(
     gdf: gpd.GeoDataFrame,
     simplify_tolerance: Optional[float] = None,
@@ -30,32 +121,25 @@ def geodataframe_to_ee(
         ee.FeatureCollection
     """
     # Ensure WGS84 for GEE
-    if gdf.crs and gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
+    if gdf.crs is not None and not gdf.crs.equals(_WGS84):
+        gdf = gdf.to_crs(_WGS84)
 
     # Simplify if requested
     if simplify_tolerance:
-        gdf = gdf.copy()
-        gdf["geometry"] = gdf["geometry"].simplify(simplify_tolerance)
-
-    # Convert to GeoJSON
-    geojson = json.loads(gdf.to_json())
+        gdf = _replace_geometry(
+            gdf, shapely.simplify(np.asarray(gdf.geometry.values), simplify_tolerance)
+        )
 
-    # Create EE features
-    features = []
-    for feature in geojson["features"]:
-        # Convert geometry
-        geom = ee.Geometry(feature["geometry"])
+    # Convert to GeoJSON dict directly (no serialize/parse round-trip)
+    geojson = _to_geojson_dict(gdf)
 
-        # Convert properties (handle None values)
-        props = {}
-        for key, value in feature.get("properties", {}).items():
-            if value is not None:
-                props[key] = value
-
-        ee_feature = ee.Feature(geom, props)
-        features.append(ee_feature)
+    # Drop None-valued properties (EE rejects nulls)
+    features = geojson["features"]
+    for feature in features:
+        props = feature.get("properties") or {}
+        feature["properties"] = {k: v for k, v in props.items() if v is not None}
 
+    # EE builds the features from the GeoJSON dicts in a single call
     return ee.FeatureCollection(features)
 
 
@@ -72,11 +156,11 @@ def aoi_to_ee_geometry(gdf: gpd.GeoDataFrame) -> ee.Geometry:
         ee.Geometry
     """
     # Ensure WGS84
-    if gdf.crs and gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
+    if gdf.crs is not None and not gdf.crs.equals(_WGS84):
+        gdf = gdf.to_crs(_WGS84)
 
     # Dissolve to single geometry
-    dissolved = gdf.unary_union
+    dissolved = _dissolve(gdf)
 
     # Convert to GeoJSON dict
     geojson = mapping(dissolved)
@@ -102,23 +186,27 @@ def create_buffered_aoi(
     """
     # Convert to projected CRS for buffering
     original_crs = gdf.crs
+    if original_crs is None:
+        raise ValueError("Cannot buffer an AOI without a CRS. Set one with set_crs() first.")
+
+    # Use UTM for accurate buffering; the bounds center is enough to pick a zone
+    minx, miny, maxx, maxy = gdf.total_bounds
+    center_x = (minx + maxx) * 0.5
+    center_y = (miny + maxy) * 0.5
+    utm_zone = int((center_x + 180) // 6) + 1
+    hemisphere = "north" if center_y >= 0 else "south"
+    to_utm, from_utm = _utm_transformers(
+        CRS.from_user_input(original_crs), utm_zone, hemisphere
+    )
 
-    # Use UTM for accurate buffering
-    centroid = gdf.unary_union.centroid
-    utm_zone = int((centroid.x + 180) / 6) + 1
-    hemisphere = "north" if centroid.y >= 0 else "south"
-    utm_crs = f"+proj=utm +zone={utm_zone} +{hemisphere} +datum=WGS84"
-
-    gdf_utm = gdf.to_crs(utm_crs)
-
-    # Apply buffer
-    gdf_buffered = gdf_utm.copy()
-    gdf_buffered["geometry"] = gdf_utm.geometry.buffer(
-        buffer_distance, cap_style=cap_style
+    # Apply buffer in UTM, then convert back to the original CRS
+    geoms_utm = _transform(np.asarray(gdf.geometry.values), to_utm)
+    buffered = _parallel(
+        lambda chunk: shapely.buffer(chunk, buffer_distance, cap_style=cap_style),
+        geoms_utm,
     )
 
-    # Convert back to original CRS
-    return gdf_buffered.to_crs(original_crs)
+    return _replace_geometry(gdf, _transform(buffered, from_utm))
 
 
 def get_aoi_bounds(gdf: gpd.GeoDataFrame) -> Dict:
@@ -144,30 +232,51 @@ def get_aoi_centroid(gdf: gpd.GeoDataFrame) -> Dict:
     """
     Get centroid of AOI.
 
+    Uses the area-weighted mean of per-feature centroids, which equals the
+    centroid of the dissolved AOI for non-overlapping polygons without
+    running a GEOS union. AOIs without area (points, lines) are dissolved.
+
     Args:
         gdf: Input GeoDataFrame
 
     Returns:
         Dictionary with lat, lon
     """
-    centroid = gdf.unary_union.centroid
+    geoms = np.asarray(gdf.geometry.values)
+    geoms = geoms[~shapely.is_missing(geoms)]
+    areas = shapely.area(geoms)
+    total = areas.sum()
+
+    if total > 0:
+        centroids = shapely.centroid(geoms)
+        return {
+            "lon": float((shapely.get_x(centroids) * areas).sum() / total),
+            "lat": float((shapely.get_y(centroids) * areas).sum() / total),
+        }
+
+    centroid = _dissolve(gdf).centroid
     return {
         "lon": centroid.x,
         "lat": centroid.y,
     }
 
 
-def get_aoi_area(gdf: gpd.GeoDataFrame) -> float:
+def get_aoi_area(gdf: gpd.GeoDataFrame, assume_disjoint: bool = False) -> float:
     """
     Calculate area of AOI in hectares.
 
     Args:
         gdf: Input GeoDataFrame
+        assume_disjoint: Sum per-feature areas instead of dissolving first.
+            Exact for non-overlapping features, an upper bound otherwise.
 
     Returns:
         Area in hectares
     """
     # Project to equal-area CRS
-    gdf_projected = gdf.to_crs("+proj=eck4")
-    area_m2 = gdf_projected.unary_union.area
+    gdf_projected = gdf.to_crs(_ECK4)
+    if assume_disjoint:
+        area_m2 = float(shapely.area(np.asarray(gdf_projected.geometry.values)).sum())
+    else:
+        area_m2 = _dissolve(gdf_projected).area
     return area_m2 / 10000  # Convert to hectares
@@ -6,15 +6,43 @@ Follows SOLID principles:
 - Open/Closed: New formats can be added via the loader registry
 """
 
-from typing import Optional
+from typing import Optional, Union
 from pathlib import Path
 from abc import ABC, abstractmethod
+from functools import lru_cache
+import importlib.util
+import io
 import json
+import os
 import zipfile
-import tempfile
 
 import geopandas as gpd
-from shapely.geometry import Point, LineString, Polygon
+import numpy as np
+import shapely
+
+from engine.io.aoi.geometry import _parallel
+
+
+# pyogrio reads through a vectorized C path; Arrow transfer needs pyarrow
+_HAS_PYOGRIO = importlib.util.find_spec("pyogrio") is not None
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# orjson is optional; the stdlib parser handles bytes just as well, only slower
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _read_vector(filepath: str) -> gpd.GeoDataFrame:
+    """Read a vector file, preferring pyogrio (with Arrow when available)."""
+    if _HAS_PYOGRIO:
+        try:
+            return gpd.read_file(filepath, engine="pyogrio", use_arrow=_HAS_PYARROW)
+        except ImportError:
+            # Installed but not importable (e.g. broken build): use the default engine
+            pass
+    return gpd.read_file(filepath)
 
 
 # =============================================================================
@@ -22,7 +50,14 @@ from shapely.geometry import Point, LineString, Polygon
 # =============================================================================
 
 class AOILoader(ABC):
-    """Abstract base class for AOI loaders."""
+    """
+    Abstract base class for AOI loaders.
+
+    Loaders that declare ``extensions`` are indexed for O(1) lookup in
+    ``get_loader``; others are matched through ``supports``.
+    """
+
+    extensions: tuple = ()
 
     @abstractmethod
     def load(self, filepath: str) -> gpd.GeoDataFrame:
@@ -42,32 +77,72 @@ class AOILoader(ABC):
 class GeoPackageLoader(AOILoader):
     """Load AOI from GeoPackage format."""
 
+    extensions = (".gpkg",)
+
     def supports(self, filepath: str) -> bool:
-        return filepath.lower().endswith(".gpkg")
+        return filepath.lower().endswith(self.extensions)
 
     def load(self, filepath: str) -> gpd.GeoDataFrame:
-        return gpd.read_file(filepath)
+        return _read_vector(filepath)
 
 
 class ShapefileLoader(AOILoader):
     """Load AOI from Shapefile format."""
 
+    extensions = (".shp",)
+
     def supports(self, filepath: str) -> bool:
-        return filepath.lower().endswith(".shp")
+        return filepath.lower().endswith(self.extensions)
 
     def load(self, filepath: str) -> gpd.GeoDataFrame:
-        return gpd.read_file(filepath)
+        return _read_vector(filepath)
 
 
 class GeoJSONLoader(AOILoader):
     """Load AOI from GeoJSON format."""
 
+    extensions = (".geojson", ".json")
+
+    def supports(self, filepath: str) -> bool:
+        return filepath.lower().endswith(self.extensions)
+
+    def load(self, filepath: str) -> gpd.GeoDataFrame:
+        return _read_vector(filepath)
+
+
+class GeoJSONSeqLoader(AOILoader):
+    """
+    Load AOI from newline-delimited GeoJSON (GeoJSONSeq / NDJSON).
+
+    Features are parsed one line at a time, so the full JSON document is
+    never held in memory.
+    """
+
+    extensions = (".geojsonl", ".geojsons", ".ndjson")
+
     def supports(self, filepath: str) -> bool:
-        ext = filepath.lower()
-        return ext.endswith(".geojson") or ext.endswith(".json")
+        return filepath.lower().endswith(self.extensions)
 
     def load(self, filepath: str) -> gpd.GeoDataFrame:
-        return gpd.read_file(filepath)
+        return _read_geojson_seq(filepath)
+
+
+class FlatGeobufLoader(AOILoader):
+    """
+    Load AOI from FlatGeobuf format.
+
+    FlatGeobuf is a binary, columnar layout with a built-in spatial index,
+    so reading it skips the text parsing needed for KML/GeoJSON. It is also
+    the on-disk cache format used by ``load_aoi(cache=True)``.
+    """
+
+    extensions = (".fgb",)
+
+    def supports(self, filepath: str) -> bool:
+        return filepath.lower().endswith(self.extensions)
+
+    def load(self, filepath: str) -> gpd.GeoDataFrame:
+        return _read_vector(filepath)
 
 
 class KMZLoader(AOILoader):
@@ -77,8 +152,10 @@ class KMZLoader(AOILoader):
     Extracts KML from the KMZ archive and parses it.
     """
 
+    extensions = (".kmz",)
+
     def supports(self, filepath: str) -> bool:
-        return filepath.lower().endswith(".kmz")
+        return filepath.lower().endswith(self.extensions)
 
     def load(self, filepath: str) -> gpd.GeoDataFrame:
         return kmz_to_geodataframe(filepath)
@@ -87,8 +164,10 @@ class KMZLoader(AOILoader):
 class KMLLoader(AOILoader):
     """Load AOI from KML format."""
 
+    extensions = (".kml",)
+
     def supports(self, filepath: str) -> bool:
-        return filepath.lower().endswith(".kml")
+        return filepath.lower().endswith(self.extensions)
 
     def load(self, filepath: str) -> gpd.GeoDataFrame:
         return _read_kml_file(filepath)
@@ -98,22 +177,38 @@ class KMLLoader(AOILoader):
 # LOADER REGISTRY
 # =============================================================================
 
-LOADER_REGISTRY: list[AOILoader] = [
-    GeoPackageLoader(),
-    ShapefileLoader(),
-    GeoJSONLoader(),
-    KMZLoader(),
-    KMLLoader(),
-]
+LOADER_REGISTRY: list[AOILoader] = []
+
+# Extension -> loader index (first registered loader wins, as in a linear scan)
+_EXT_MAP: dict[str, AOILoader] = {}
 
 
 def register_loader(loader: AOILoader) -> None:
     """Register a custom AOI loader."""
     LOADER_REGISTRY.append(loader)
+    for ext in loader.extensions:
+        _EXT_MAP.setdefault(ext.lower(), loader)
+
+
+for _loader in (
+    GeoPackageLoader(),
+    ShapefileLoader(),
+    GeoJSONLoader(),
+    GeoJSONSeqLoader(),
+    FlatGeobufLoader(),
+    KMZLoader(),
+    KMLLoader(),
+):
+    register_loader(_loader)
 
 
 def get_loader(filepath: str) -> AOILoader:
     """Get appropriate loader for file format."""
+    loader = _EXT_MAP.get(os.path.splitext(filepath)[1].lower())
+    if loader is not None:
+        return loader
+
+    # Custom loaders that match on more than the extension
     for loader in LOADER_REGISTRY:
         if loader.supports(filepath):
             return loader
@@ -124,8 +219,9 @@ def get_loader(filepath: str) -> AOILoader:
 # CORE FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=None)
 def _enable_kml_driver():
-    """Enable KML driver for fiona/geopandas."""
+    """Enable KML driver for fiona/geopandas (idempotent, runs once)."""
     try:
         import fiona
         fiona.drv.supported_drivers["KML"] = "rw"
@@ -140,11 +236,17 @@ def _enable_kml_driver():
         pass
 
 
+# Register the KML drivers once; readers below assume they are enabled
+_enable_kml_driver()
+
+
 def kmz_to_geodataframe(kmz_path: str) -> gpd.GeoDataFrame:
     """
     Extract and parse KMZ file to GeoDataFrame.
 
-    KMZ files are ZIP archives containing a doc.kml file.
+    KMZ files are ZIP archives containing a doc.kml file. Only the KML
+    member is read, straight into memory; other archive entries (images,
+    overlays) are never extracted.
 
     Args:
         kmz_path: Path to KMZ file
@@ -152,36 +254,57 @@ def kmz_to_geodataframe(kmz_path: str) -> gpd.GeoDataFrame:
     Returns:
         GeoDataFrame with geometries from the KMZ
     """
-    _enable_kml_driver()
+    with zipfile.ZipFile(kmz_path, "r") as zf:
+        # Find the KML file (doc.kml by convention, else any KML)
+        names = zf.namelist()
+        kml_name = "doc.kml" if "doc.kml" in names else next(
+            (name for name in names if name.lower().endswith(".kml")), None
+        )
+        if kml_name is None:
+            raise ValueError(f"No KML file found in KMZ: {kmz_path}")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Extract KMZ (it's a ZIP file)
-        with zipfile.ZipFile(kmz_path, "r") as zf:
-            zf.extractall(tmpdir)
+        kml_data = zf.read(kml_name)
 
-        # Find the KML file
-        kml_path = Path(tmpdir) / "doc.kml"
-        if not kml_path.exists():
-            # Try to find any KML file
-            kml_files = list(Path(tmpdir).glob("*.kml"))
-            if not kml_files:
-                raise ValueError(f"No KML file found in KMZ: {kmz_path}")
-            kml_path = kml_files[0]
+    # Read KML with multiple fallback methods
+    return _read_kml_file(kml_data)
 
-        # Read KML with multiple fallback methods
-        gdf = _read_kml_file(str(kml_path))
 
-    return gdf
+def _read_geojson_seq(filepath: str) -> gpd.GeoDataFrame:
+    """Stream a GeoJSONSeq file feature by feature into a GeoDataFrame."""
+    from shapely.geometry import shape
+
+    geometries = []
+    properties = []
+
+    with open(filepath, "rb") as f:
+        for line in f:
+            # RFC 8142 prefixes each record with an ASCII record separator
+            line = line.strip(b"\x1e \t\r\n")
+            if not line:
+                continue
+            feature = _json_loads(line)
+            geometry = feature.get("geometry")
+            geometries.append(shape(geometry) if geometry else None)
+            properties.append(feature.get("properties") or {})
+
+    if not geometries:
+        raise ValueError(f"No features found in GeoJSONSeq file: {filepath}")
+
+    return gpd.GeoDataFrame(properties, geometry=geometries, crs="EPSG:4326")
+
+
+def _kml_source(kml: Union[str, bytes]):
+    """Return a readable source for a KML path or in-memory KML bytes."""
+    return io.BytesIO(kml) if isinstance(kml, bytes) else kml
 
 
-def _read_kml_file(kml_path: str) -> gpd.GeoDataFrame:
-    """Read KML file with multiple fallback methods."""
+def _read_kml_file(kml: Union[str, bytes]) -> gpd.GeoDataFrame:
+    """Read KML file (path or in-memory bytes) with multiple fallback methods."""
     errors = []
 
     # Method 1: Try with LIBKML driver
     try:
-        _enable_kml_driver()
-        gdf = gpd.read_file(kml_path, driver="LIBKML")
+        gdf = gpd.read_file(_kml_source(kml), driver="LIBKML")
         if len(gdf) > 0:
             return gdf
     except Exception as e:
@@ -189,8 +312,7 @@ def _read_kml_file(kml_path: str) -> gpd.GeoDataFrame:
 
     # Method 2: Try with KML driver
     try:
-        _enable_kml_driver()
-        gdf = gpd.read_file(kml_path, driver="KML")
+        gdf = gpd.read_file(_kml_source(kml), driver="KML")
         if len(gdf) > 0:
             return gdf
     except Exception as e:
@@ -199,7 +321,7 @@ def _read_kml_file(kml_path: str) -> gpd.GeoDataFrame:
     # Method 3: Try pyogrio if available
     try:
         import pyogrio
-        gdf = gpd.read_file(kml_path, engine="pyogrio")
+        gdf = gpd.read_file(_kml_source(kml), engine="pyogrio")
         if len(gdf) > 0:
             return gdf
     except Exception as e:
@@ -207,7 +329,7 @@ def _read_kml_file(kml_path: str) -> gpd.GeoDataFrame:
 
     # Method 4: Parse KML manually with xml
     try:
-        gdf = _parse_kml_manually(kml_path)
+        gdf = _parse_kml_manually(_kml_source(kml))
         if len(gdf) > 0:
             return gdf
     except Exception as e:
@@ -216,67 +338,147 @@ def _read_kml_file(kml_path: str) -> gpd.GeoDataFrame:
     raise ValueError(f"Failed to read KML: {'; '.join(errors)}")
 
 
-def _parse_kml_manually(kml_path: str) -> gpd.GeoDataFrame:
-    """Parse KML file manually using xml.etree."""
-    import xml.etree.ElementTree as ET
+# Geometry types recognised by the manual KML parser, in lookup order
+_KML_GEOMETRY_TAGS = ("Point", "LineString", "Polygon")
 
-    tree = ET.parse(kml_path)
-    root = tree.getroot()
 
-    # Handle KML namespace
-    ns = {'kml': 'http://www.opengis.net/kml/2.2'}
+def _kml_patterns(ns: str) -> tuple:
+    """
+    Build the Placemark tag and find() paths for one KML namespace.
 
-    # Try without namespace first
-    placemarks = root.findall('.//Placemark')
-    if not placemarks:
-        placemarks = root.findall('.//{http://www.opengis.net/kml/2.2}Placemark')
+    Exact qualified names avoid ``{*}`` wildcard matching, and ElementTree
+    caches each compiled path, so every pattern is compiled once per file.
+    """
+    q = f"{{{ns}}}" if ns else ""
+    geometry_paths = tuple(
+        (kind, f".//{q}{kind}//{q}coordinates") for kind in _KML_GEOMETRY_TAGS
+    )
+    return f"{q}Placemark", f"{q}name", geometry_paths
 
-    geometries = []
-    names = []
 
-    for pm in placemarks:
-        name_elem = pm.find('name') or pm.find('{http://www.opengis.net/kml/2.2}name')
-        name = name_elem.text if name_elem is not None else ""
-        names.append(name)
-
-        # Try to find Point
-        point = pm.find('.//Point//coordinates') or pm.find('.//{http://www.opengis.net/kml/2.2}Point//{http://www.opengis.net/kml/2.2}coordinates')
-        if point is not None:
-            coords = point.text.strip().split(',')
-            lon, lat = float(coords[0]), float(coords[1])
-            geometries.append(Point(lon, lat))
-            continue
+def _parse_kml_coordinates(text: str) -> np.ndarray:
+    """
+    Parse a KML coordinates string into an (N, 2) lon/lat array.
+
+    All tuples are parsed in a single C call when they share one width
+    (2, or 3 with altitude); strings mixing 2D and 3D tuples fall back to
+    per-tuple parsing. Altitude is dropped.
+    """
+    tuples = text.split()
+    ndim = tuples[0].count(",") + 1
+    values = np.fromstring(" ".join(tuples).replace(",", " "), dtype=np.float64, sep=" ")
+    if values.size != len(tuples) * ndim:
+        # Mixed tuple widths: a flat reshape would misalign lon/lat pairs
+        return np.array(
+            [[float(v) for v in t.split(",")[:2]] for t in tuples],
+            dtype=np.float64,
+        )
+    return values.reshape(-1, ndim)[:, :2]
+
+
+def _parse_kml_manually(kml_source) -> gpd.GeoDataFrame:
+    """
+    Parse KML file manually using xml.etree.
+
+    Placemarks are streamed with iterparse and their coordinates collected
+    into one flat array, so geometries are built with a single shapely
+    constructor call per geometry type. The KML namespace (2.2, 2.1 or
+    none) is read from the root element's tag, so prefixed documents
+    (``<kml:kml>``) and nested default-namespace declarations are handled,
+    and only the patterns for that namespace are used.
+    """
+    import xml.etree.ElementTree as ET
 
-        # Try to find LineString
-        line = pm.find('.//LineString//coordinates') or pm.find('.//{http://www.opengis.net/kml/2.2}LineString//{http://www.opengis.net/kml/2.2}coordinates')
-        if line is not None:
-            coords_list = []
-            for coord in line.text.strip().split():
-                parts = coord.split(',')
-                coords_list.append((float(parts[0]), float(parts[1])))
-            geometries.append(LineString(coords_list))
+    names = []
+    kinds = []
+    coords = []
+    offsets = [0]
+
+    placemark_tag = None
+
+    for event, elem in ET.iterparse(kml_source, events=("start", "end")):
+        if event == "start":
+            if placemark_tag is None:
+                # Root element: "{uri}kml" or plain "kml"
+                ns = elem.tag[1:].partition("}")[0] if elem.tag.startswith("{") else ""
+                placemark_tag, name_path, geometry_paths = _kml_patterns(ns)
             continue
 
-        # Try to find Polygon
-        poly = pm.find('.//Polygon//coordinates') or pm.find('.//{http://www.opengis.net/kml/2.2}Polygon//{http://www.opengis.net/kml/2.2}coordinates')
-        if poly is not None:
-            coords_list = []
-            for coord in poly.text.strip().split():
-                parts = coord.split(',')
-                coords_list.append((float(parts[0]), float(parts[1])))
-            geometries.append(Polygon(coords_list))
+        if elem.tag != placemark_tag:
             continue
 
-    if not geometries:
+        for kind, path in geometry_paths:
+            node = elem.find(path)
+            if node is not None and node.text and node.text.strip():
+                name_elem = elem.find(name_path)
+                names.append(name_elem.text if name_elem is not None else "")
+                kinds.append(kind)
+                xy = _parse_kml_coordinates(node.text)
+                coords.append(xy)
+                offsets.append(offsets[-1] + len(xy))
+                break
+
+        elem.clear()
+
+    if not kinds:
         raise ValueError("No geometries found in KML")
 
+    xy = np.concatenate(coords)
+    kinds = np.asarray(kinds)
+    offsets = np.asarray(offsets)
+    owner = np.repeat(np.arange(len(kinds)), np.diff(offsets))
+    geometries = np.empty(len(kinds), dtype=object)
+
+    # Points: first coordinate of each point placemark
+    is_point = kinds == "Point"
+    if is_point.any():
+        geometries[is_point] = shapely.points(xy[offsets[:-1][is_point]])
+
+    # Lines and polygon outer rings: one ragged-array constructor call each
+    for kind in ("LineString", "Polygon"):
+        selected = kinds == kind
+        if not selected.any():
+            continue
+        rows = selected[owner]
+        _, parts = np.unique(owner[rows], return_inverse=True)
+        if kind == "LineString":
+            geometries[selected] = shapely.linestrings(xy[rows], indices=parts)
+        else:
+            rings = shapely.linearrings(xy[rows], indices=parts)
+            geometries[selected] = shapely.polygons(rings)
+
     # Create GeoDataFrame without CRS (will be set by load_aoi)
-    gdf = gpd.GeoDataFrame({'name': names, 'geometry': geometries})
+    gdf = gpd.GeoDataFrame({"name": names}, geometry=geometries)
 
     return gdf
 
 
-def load_aoi(filepath: str) -> gpd.GeoDataFrame:
+def _fgb_cache_path(filepath: str) -> Optional[Path]:
+    """
+    Return the FlatGeobuf cache path for a source file (None for .fgb inputs).
+
+    The name keeps the full source filename (``aoi.kml.cache.fgb``), so
+    sources sharing a stem get separate caches and a user's own
+    ``aoi.fgb`` is never overwritten.
+    """
+    path = Path(filepath)
+    if path.suffix.lower() in FlatGeobufLoader.extensions:
+        return None
+    return path.with_name(path.name + ".cache.fgb")
+
+
+def _write_fgb_cache(gdf: gpd.GeoDataFrame, cache_path: Path) -> None:
+    """Write a FlatGeobuf cache file; failures (read-only dirs, etc.) are ignored."""
+    try:
+        if _HAS_PYOGRIO:
+            gdf.to_file(cache_path, driver="FlatGeobuf", engine="pyogrio")
+        else:
+            gdf.to_file(cache_path, driver="FlatGeobuf")
+    except Exception:
+        pass
+
+
+def load_aoi(filepath: str, cache: bool = False) -> gpd.GeoDataFrame:
     """
     Load AOI from any supported format.
 
@@ -284,6 +486,8 @@ def load_aoi(filepath: str) -> gpd.GeoDataFrame:
 
     Args:
         filepath: Path to AOI file
+        cache: Keep a FlatGeobuf copy next to the source file and read it
+            instead of re-parsing the source while it is up to date
 
     Returns:
         GeoDataFrame with AOI geometry
@@ -292,6 +496,16 @@ def load_aoi(filepath: str) -> gpd.GeoDataFrame:
         ValueError: If format is not supported
     """
     loader = get_loader(filepath)
+
+    cache_path = _fgb_cache_path(filepath) if cache else None
+    if cache_path is not None:
+        try:
+            if cache_path.stat().st_mtime >= os.stat(filepath).st_mtime:
+                return FlatGeobufLoader().load(str(cache_path))
+        except OSError:
+            # No cache yet (or unreadable source, reported by the loader)
+            pass
+
     gdf = loader.load(filepath)
 
     # Ensure CRS is set (default to WGS84 if missing)
@@ -303,6 +517,9 @@ def load_aoi(filepath: str) -> gpd.GeoDataFrame:
             from pyproj import CRS
             gdf.crs = CRS.from_epsg(4326)
 
+    if cache_path is not None:
+        _write_fgb_cache(gdf, cache_path)
+
     return gdf
 
 
@@ -310,8 +527,8 @@ def validate_geometry(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
     Validate and fix geometries.
 
-    - Fixes invalid geometries with buffer(0)
-    - Removes empty geometries
+    - Repairs invalid geometries with GEOS make_valid (vectorized)
+    - Removes empty and missing geometries
     - Ensures consistent geometry types
 
     Args:
@@ -320,15 +537,16 @@ def validate_geometry(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     Returns:
         Cleaned GeoDataFrame
     """
-    gdf = gdf.copy()
+    geoms = np.array(gdf.geometry.values, dtype=object)
 
     # Fix invalid geometries
-    gdf["geometry"] = gdf["geometry"].apply(
-        lambda g: g.buffer(0) if g is not None and not g.is_valid else g
-    )
+    present = ~shapely.is_missing(geoms)
+    invalid = present & ~shapely.is_valid(geoms)
+    if invalid.any():
+        geoms[invalid] = _parallel(shapely.make_valid, geoms[invalid])
 
-    # Remove empty geometries
-    gdf = gdf[~gdf["geometry"].is_empty]
-    gdf = gdf[gdf["geometry"].notna()]
+    gdf = gdf.copy()
+    gdf[gdf.geometry.name] = gpd.GeoSeries(geoms, index=gdf.index, crs=gdf.crs)
 
-    return gdf
+    # Remove empty and missing geometries in one masked selection
+    return gdf[present & ~shapely.is_empty(geoms)]
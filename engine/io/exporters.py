@@ -11,7 +11,8 @@ Follows SOLID principles:
 - Open/Closed: New export formats via strategy pattern
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, TypeVar
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -184,6 +185,29 @@ class CloudStorageExporter(Exporter):
         return task
 
 
+# =============================================================================
+# CONCURRENT EE REQUESTS
+# =============================================================================
+
+# Task starts and status polls are independent HTTP calls to EE
+_MAX_REQUEST_WORKERS = 8
+
+_T = TypeVar("_T")
+
+
+def _map_concurrent(fn: Callable[[ee.batch.Task], _T], tasks: List[ee.batch.Task]) -> List[_T]:
+    """Apply ``fn`` to each task on a thread pool, preserving order."""
+    if len(tasks) < 2:
+        return [fn(task) for task in tasks]
+    with ThreadPoolExecutor(max_workers=min(_MAX_REQUEST_WORKERS, len(tasks))) as pool:
+        return list(pool.map(fn, tasks))
+
+
+def _start_all(tasks: Dict[str, ee.batch.Task]) -> None:
+    """Start every task concurrently, re-raising the first failure."""
+    _map_concurrent(lambda task: task.start(), list(tasks.values()))
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -346,10 +370,13 @@ def export_all_composites(
             region=region,
             site_name=site_name,
             config=config,
-            start=start,
+            start=False,
         )
         tasks[period_name] = task
 
+    if start:
+        _start_all(tasks)
+
     return tasks
 
 
@@ -382,10 +409,13 @@ def export_all_changes(
             region=region,
             site_name=site_name,
             config=config,
-            start=start,
+            start=False,
         )
         tasks[comparison_name] = task
 
+    if start:
+        _start_all(tasks)
+
     return tasks
 
 
@@ -424,10 +454,8 @@ def monitor_tasks(tasks: Dict[str, ee.batch.Task]) -> Dict[str, Dict]:
     Returns:
         Dictionary of name -> status
     """
-    statuses = {}
-    for name, task in tasks.items():
-        statuses[name] = get_task_status(task)
-    return statuses
+    statuses = _map_concurrent(get_task_status, list(tasks.values()))
+    return dict(zip(tasks, statuses))
 
 
 def wait_for_tasks(
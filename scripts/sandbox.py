@@ -11,18 +11,32 @@ Usage:
     python scripts/sandbox.py --quick         # Quick smoke test
     python scripts/sandbox.py --verbose       # Detailed output
     python scripts/sandbox.py --report        # Generate HTML report
+    python scripts/sandbox.py --report out.html.gz  # Gzip-compressed report
 """
 
 import argparse
+import gzip
 import json
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import MagicMock, patch
 
+# orjson is optional; it is much faster for large result sets
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
 
 # =============================================================================
 # Configuration
@@ -114,9 +128,8 @@ class TestMetrics:
 # Test Utilities
 # =============================================================================
 
-def run_test(name: str, test_func, metrics: TestMetrics, verbose: bool = False):
-    """Run a single test and record results."""
-    print(f"  Testing: {name}...", end=" ", flush=True)
+def _execute_test(name: str, test_func) -> TestResult:
+    """Run a single test function and return its result without printing."""
     start = time.perf_counter()
 
     try:
@@ -129,31 +142,75 @@ def run_test(name: str, test_func, metrics: TestMetrics, verbose: bool = False):
             passed = bool(result)
             message = ""
 
-        metrics.add_result(TestResult(
+        return TestResult(
             name=name,
             passed=passed,
             duration=duration,
             message=message
-        ))
-
-        if passed:
-            print(f"PASS ({duration:.3f}s)")
-        else:
-            print(f"FAIL ({duration:.3f}s)")
-            if verbose and message:
-                print(f"    -> {message}")
+        )
 
     except Exception as e:
         duration = time.perf_counter() - start
-        metrics.add_result(TestResult(
+        return TestResult(
             name=name,
             passed=False,
             duration=duration,
-            message=str(e)
-        ))
-        print(f"ERROR ({duration:.3f}s)")
-        if verbose:
-            print(f"    -> {e}")
+            message=str(e),
+            details={"error": type(e).__name__}
+        )
+
+
+def _print_outcome(result: TestResult, verbose: bool = False):
+    """Print the status suffix of a test line."""
+    if result.passed:
+        print(f"PASS ({result.duration:.3f}s)")
+        return
+
+    errored = bool(result.details and "error" in result.details)
+    print(f"{'ERROR' if errored else 'FAIL'} ({result.duration:.3f}s)")
+    if verbose and result.message:
+        print(f"    -> {result.message}")
+
+
+def run_test(name: str, test_func, metrics: TestMetrics, verbose: bool = False):
+    """Run a single test and record results."""
+    print(f"  Testing: {name}...", end=" ", flush=True)
+    result = _execute_test(name, test_func)
+    metrics.add_result(result)
+    _print_outcome(result, verbose)
+
+
+def run_tests_parallel(
+    tests: List[Tuple[str, Any]],
+    metrics: TestMetrics,
+    verbose: bool = False,
+    serial: Tuple[Any, ...] = (),
+):
+    """
+    Run independent tests in a thread pool, reporting in declaration order.
+
+    Workers return TestResult objects instead of touching ``metrics`` or
+    stdout, so results are recorded and printed in the original order once
+    they are available. Tests in ``serial`` (e.g. ones that patch module
+    globals) run on the calling thread after the pool has drained.
+    """
+    parallel = [(name, fn) for name, fn in tests if fn not in serial]
+    workers = min(len(parallel), os.cpu_count() or 4)
+
+    futures = {}
+    if workers > 0:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                name: executor.submit(_execute_test, name, fn)
+                for name, fn in parallel
+            }
+
+    for name, fn in tests:
+        print(f"  Testing: {name}...", end=" ", flush=True)
+        future = futures.get(name)
+        result = future.result() if future is not None else _execute_test(name, fn)
+        metrics.add_result(result)
+        _print_outcome(result, verbose)
 
 
 # =============================================================================
@@ -351,45 +408,48 @@ def test_api_models() -> Tuple[bool, str]:
 # Main Execution
 # =============================================================================
 
+# Single source of truth for both suites: (name, test function, tags).
+# "serial" marks tests that patch module globals and must not overlap others.
+_TEST_REGISTRY: List[Tuple[str, Any, frozenset]] = [
+    ("Imports", test_imports, frozenset({"quick", "full"})),
+    ("Configuration Structure", test_config_structure, frozenset({"quick", "full"})),
+    ("Index Registry", test_index_registry, frozenset({"quick", "full"})),
+    ("Threshold Ordering", test_threshold_ordering, frozenset({"full"})),
+    ("Period Date Validity", test_period_date_validity, frozenset({"full"})),
+    ("AOI Loading", test_aoi_loading, frozenset({"full"})),
+    ("Orchestrator Init", test_orchestrator_initialization, frozenset({"full"})),
+    ("Mock Analysis", test_mock_analysis, frozenset({"full", "serial"})),
+    ("API Models", test_api_models, frozenset({"full"})),
+]
+
+
+def _run_suite(tag: str, metrics: TestMetrics, verbose: bool = False):
+    """Run every registered test carrying ``tag``."""
+    tests = [(name, fn) for name, fn, tags in _TEST_REGISTRY if tag in tags]
+    serial = tuple(fn for _, fn, tags in _TEST_REGISTRY if "serial" in tags)
+    run_tests_parallel(tests, metrics, verbose, serial=serial)
+
+
 def run_quick_tests(metrics: TestMetrics, verbose: bool = False):
     """Run quick smoke tests."""
     print("\n Quick Smoke Tests")
     print("-" * 40)
-
-    tests = [
-        ("Imports", test_imports),
-        ("Configuration", test_config_structure),
-        ("Index Registry", test_index_registry),
-    ]
-
-    for name, test_func in tests:
-        run_test(name, test_func, metrics, verbose)
+    _run_suite("quick", metrics, verbose)
 
 
 def run_all_tests(metrics: TestMetrics, verbose: bool = False):
     """Run all tests."""
     print("\n Module Tests")
     print("-" * 40)
+    _run_suite("full", metrics, verbose)
 
-    tests = [
-        ("Imports", test_imports),
-        ("Configuration Structure", test_config_structure),
-        ("Index Registry", test_index_registry),
-        ("Threshold Ordering", test_threshold_ordering),
-        ("Period Date Validity", test_period_date_validity),
-        ("AOI Loading", test_aoi_loading),
-        ("Orchestrator Init", test_orchestrator_initialization),
-        ("Mock Analysis", test_mock_analysis),
-        ("API Models", test_api_models),
-    ]
-
-    for name, test_func in tests:
-        run_test(name, test_func, metrics, verbose)
 
+# =============================================================================
+# HTML Report Templates
+# =============================================================================
 
-def generate_html_report(metrics: TestMetrics, output_path: str = "sandbox_report.html"):
-    """Generate HTML report."""
-    html = f"""<!DOCTYPE html>
+# Built once at import; generate_html_report only fills in the summary values
+_REPORT_HEADER_TMPL = """<!DOCTYPE html>
 <html>
 <head>
     <title>Verdant Sandbox Report</title>
@@ -409,6 +469,7 @@ def generate_html_report(metrics: TestMetrics, output_path: str = "sandbox_repor
         .pass {{ color: #2e7d32; font-weight: bold; }}
         .fail {{ color: #c62828; font-weight: bold; }}
         .timestamp {{ color: #666; font-size: 14px; margin-top: 20px; }}
+        .pager {{ display: flex; gap: 10px; align-items: center; margin-top: 15px; }}
     </style>
 </head>
 <body>
@@ -417,19 +478,19 @@ def generate_html_report(metrics: TestMetrics, output_path: str = "sandbox_repor
 
         <div class="summary">
             <div class="stat">
-                <h2>{metrics.total}</h2>
+                <h2>{total}</h2>
                 <p>Total Tests</p>
             </div>
             <div class="stat">
-                <h2>{metrics.passed}</h2>
+                <h2>{passed}</h2>
                 <p>Passed</p>
             </div>
-            <div class="stat {'failed' if metrics.failed > 0 else ''}">
-                <h2>{metrics.failed}</h2>
+            <div class="stat {failed_class}">
+                <h2>{failed}</h2>
                 <p>Failed</p>
             </div>
             <div class="stat">
-                <h2>{metrics.duration:.2f}s</h2>
+                <h2>{duration:.2f}s</h2>
                 <p>Duration</p>
             </div>
         </div>
@@ -443,33 +504,99 @@ def generate_html_report(metrics: TestMetrics, output_path: str = "sandbox_repor
                     <th>Message</th>
                 </tr>
             </thead>
-            <tbody>
-"""
-
-    for result in metrics.results:
-        status_class = "pass" if result.passed else "fail"
-        status_text = "PASS" if result.passed else "FAIL"
-        html += f"""
-                <tr>
-                    <td>{result.name}</td>
-                    <td class="{status_class}">{status_text}</td>
-                    <td>{result.duration:.3f}s</td>
-                    <td>{result.message}</td>
-                </tr>
-"""
-
-    html += f"""
-            </tbody>
+            <tbody id="results"></tbody>
         </table>
 
-        <p class="timestamp">Generated: {metrics.start_time.strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <div class="pager">
+            <button id="prev">Previous</button>
+            <span id="page"></span>
+            <button id="next">Next</button>
+        </div>
+
+        <p class="timestamp">Generated: {generated}</p>
     </div>
+
+    <script type="application/json" id="verdant-data">"""
+
+# Escapes applied to the embedded JSON in one translate() pass, so test names
+# and messages can neither close the <script> element nor open a comment
+# (same set as Django's json_script); JSON.parse restores the characters
+_JSON_SCRIPT_ESCAPES = str.maketrans({
+    "<": "\\u003c",
+    ">": "\\u003e",
+    "&": "\\u0026",
+})
+
+# Closes the embedded JSON data element and renders its rows client-side
+_REPORT_SCRIPT = """</script>
+    <script>
+        const data = JSON.parse(document.getElementById("verdant-data").textContent);
+        const results = data.results;
+        const pageSize = 100;
+        const tbody = document.getElementById("results");
+        const pages = Math.max(1, Math.ceil(results.length / pageSize));
+        let current = 0;
+
+        function cell(text, className) {
+            const td = document.createElement("td");
+            td.textContent = text;
+            if (className) td.className = className;
+            return td;
+        }
+
+        function renderPage(page) {
+            current = Math.min(Math.max(page, 0), pages - 1);
+            const frag = document.createDocumentFragment();
+            for (const r of results.slice(current * pageSize, (current + 1) * pageSize)) {
+                const tr = document.createElement("tr");
+                tr.appendChild(cell(r.name));
+                tr.appendChild(cell(r.passed ? "PASS" : "FAIL", r.passed ? "pass" : "fail"));
+                tr.appendChild(cell(r.duration.toFixed(3) + "s"));
+                tr.appendChild(cell(r.message || ""));
+                frag.appendChild(tr);
+            }
+            tbody.replaceChildren(frag);
+            document.getElementById("page").textContent = `Page ${current + 1} of ${pages}`;
+            document.getElementById("prev").disabled = current === 0;
+            document.getElementById("next").disabled = current === pages - 1;
+        }
+
+        document.getElementById("prev").onclick = () => renderPage(current - 1);
+        document.getElementById("next").onclick = () => renderPage(current + 1);
+        renderPage(0);
+    </script>
 </body>
 </html>
 """
 
-    with open(output_path, 'w') as f:
-        f.write(html)
+
+def generate_html_report(metrics: TestMetrics, output_path: str = "sandbox_report.html"):
+    """
+    Generate HTML report.
+
+    Results are embedded once as JSON and rendered by a small inline script,
+    100 rows per page, so large suites produce compact files that the
+    browser loads without instantiating every table row. An ``output_path``
+    ending in ``.gz`` is written gzip-compressed.
+    """
+    data = json.dumps(metrics.to_dict(), default=str).translate(_JSON_SCRIPT_ESCAPES)
+
+    if output_path.endswith('.gz'):
+        report_file = gzip.open(output_path, 'wt', encoding='utf-8', compresslevel=6)
+    else:
+        report_file = open(output_path, 'w', encoding='utf-8', buffering=1 << 20)
+
+    with report_file as f:
+        f.write(_REPORT_HEADER_TMPL.format(
+            total=metrics.total,
+            passed=metrics.passed,
+            failed=metrics.failed,
+            failed_class="failed" if metrics.failed > 0 else "",
+            duration=metrics.duration,
+            generated=metrics.start_time.strftime('%Y-%m-%d %H:%M:%S'),
+        ))
+        f.write(data)
+        f.write(_REPORT_SCRIPT)
 
     print(f"\n HTML report saved to: {output_path}")
 
@@ -478,7 +605,11 @@ def main():
     parser = argparse.ArgumentParser(description="Verdant Sandbox Testing Environment")
     parser.add_argument("--quick", action="store_true", help="Run quick smoke tests only")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-    parser.add_argument("--report", action="store_true", help="Generate HTML report")
+    parser.add_argument(
+        "--report", nargs="?", const="sandbox_report.html", metavar="PATH",
+        help="Generate HTML report (default: sandbox_report.html; "
+             "a .html.gz path writes it gzip-compressed)",
+    )
     parser.add_argument("--json", type=str, help="Export results to JSON file")
     args = parser.parse_args()
 
@@ -496,11 +627,11 @@ def main():
     print(metrics.summary())
 
     if args.report:
-        generate_html_report(metrics)
+        generate_html_report(metrics, args.report)
 
     if args.json:
-        with open(args.json, 'w') as f:
-            json.dump(metrics.to_dict(), f, indent=2)
+        with open(args.json, 'wb') as f:
+            f.write(_dumps(metrics.to_dict()))
         print(f"\n JSON results saved to: {args.json}")
 
     # Exit with appropriate code
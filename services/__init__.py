@@ -3,29 +3,39 @@ Services layer for vegetation change analysis.
 
 This module contains business logic orchestrators that coordinate
 the engine modules to perform complete analysis workflows.
+
+Symbols are resolved lazily (PEP 562), so ``import services`` does not
+load the Earth Engine stack until one of them is first used.
 """
 
-from services.change_orchestrator import (
-    ChangeOrchestrator,
-    AnalysisJob,
-    AnalysisStatus,
-    JobStore,
-    analyze_vegetation_change,
-    run_full_analysis,
-    quick_preview,
-    get_period_summary,
-)
-
-__all__ = [
+import importlib
+
+# Public name -> defining module
+_LAZY_EXPORTS = {
     # Main orchestrator
-    "ChangeOrchestrator",
+    "ChangeOrchestrator": "services.change_orchestrator",
     # Job management
-    "AnalysisJob",
-    "AnalysisStatus",
-    "JobStore",
+    "AnalysisJob": "services.change_orchestrator",
+    "AnalysisStatus": "services.change_orchestrator",
+    "JobStore": "services.change_orchestrator",
     # Convenience functions
-    "analyze_vegetation_change",
-    "run_full_analysis",
-    "quick_preview",
-    "get_period_summary",
-]
+    "analyze_vegetation_change": "services.change_orchestrator",
+    "run_full_analysis": "services.change_orchestrator",
+    "quick_preview": "services.change_orchestrator",
+    "get_period_summary": "services.change_orchestrator",
+    "use_orchestrator": "services.change_orchestrator",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
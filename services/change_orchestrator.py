@@ -11,12 +11,22 @@ Example:
     >>> results = orchestrator.get_job(job_id)
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
-from datetime import datetime
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-import uuid
+from types import MappingProxyType
+import hashlib
+import heapq
+import json
+import os
+import secrets
+import time
 import threading
 import ee
 
@@ -26,28 +36,43 @@ from engine.config import (
     TEMPORAL_PERIODS,
 )
 from engine.composites import (
-    create_all_period_composites,
     create_fused_composite,
     get_image_count,
 )
+from engine.ee_init import (
+    EEAuthenticationError,
+    has_persistent_credentials,
+    initialize_ee,
+    is_ee_initialized,
+)
 from engine.indices import add_all_indices, calculate_delta_indices
 from engine.change import (
     create_change_analysis,
-    generate_change_statistics,
-)
-from engine.io.aoi import (
-    load_aoi,
-    aoi_to_ee_geometry,
-    create_buffered_aoi,
-    get_aoi_centroid,
-    get_aoi_area,
-)
-from engine.io.exporters import (
-    export_all_composites,
-    export_all_changes,
-    ExportConfig,
+    generate_batched_change_statistics,
+    summarize_class_histogram,
 )
 
+# engine.io (geopandas/shapely/pyproj) is imported inside the file-based
+# workflows, so job management and analyze() do not pay for it at import.
+
+
+# Period -> (start, end, sensors), built once at import
+_PERIOD_INFO_CACHE: Dict[str, tuple] = {
+    name: (info["start"], info["end"], tuple(info["sensors"]))
+    for name, info in TEMPORAL_PERIODS.items()
+}
+
+# Period -> read-only get_period_summary entry, built once at import
+_PERIOD_SUMMARY: Dict[str, Mapping[str, Any]] = {
+    name: MappingProxyType({
+        "start": info["start"],
+        "end": info["end"],
+        "sensors": info["sensors"],
+        "description": info["description"],
+    })
+    for name, info in TEMPORAL_PERIODS.items()
+}
+
 
 # =============================================================================
 # JOB STATUS AND MODELS
@@ -62,6 +87,11 @@ class AnalysisStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+def _isoformat(timestamp: float) -> str:
+    """Format a POSIX timestamp as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 @dataclass
 class AnalysisJob:
     """
@@ -73,37 +103,52 @@ class AnalysisJob:
     job_id: str
     status: AnalysisStatus
     config: VegChangeConfig
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
     progress: float = 0.0
     current_step: str = ""
     results: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert job to dictionary for API responses."""
-        return {
+    def __post_init__(self):
+        # job_id and created_at never change after creation
+        self._base_dict = {
             "job_id": self.job_id,
-            "status": self.status.value,
-            "progress": self.progress,
-            "current_step": self.current_step,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "error": self.error,
-            "has_results": self.results is not None,
+            "created_at": _isoformat(self.created_at),
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert job to dictionary for API responses."""
+        d = self._base_dict.copy()
+        d.update(
+            status=self.status.value,
+            progress=self.progress,
+            current_step=self.current_step,
+            started_at=_isoformat(self.started_at) if self.started_at else None,
+            completed_at=_isoformat(self.completed_at) if self.completed_at else None,
+            error=self.error,
+            has_results=self.results is not None,
+        )
+        return d
+
+
+# Field names accepted by JobStore.update
+_JOB_FIELDS = frozenset(f.name for f in fields(AnalysisJob))
+
 
 class JobStore:
     """
     In-memory storage for analysis jobs.
 
-    Thread-safe for use with FastAPI BackgroundTasks.
+    Thread-safe for use with FastAPI BackgroundTasks. Jobs are striped
+    across shards, each with its own lock, so concurrent writers to
+    different jobs do not contend; ``get`` is a lock-free dict lookup.
     For production, replace with Redis or database.
     """
 
+    _NUM_SHARDS = 16
+
     def __init__(self, max_jobs: int = 100):
         """
         Initialize job store.
@@ -111,82 +156,340 @@ class JobStore:
         Args:
             max_jobs: Maximum number of jobs to retain
         """
-        self._jobs: Dict[str, AnalysisJob] = {}
+        self._shards: List[Dict[str, AnalysisJob]] = [{} for _ in range(self._NUM_SHARDS)]
+        self._locks = [threading.Lock() for _ in range(self._NUM_SHARDS)]
+        # Guards cleanup only, which is the one cross-shard write
         self._lock = threading.Lock()
         self._max_jobs = max_jobs
 
+    def _shard(self, job_id: str) -> int:
+        """Get the shard index for a job ID."""
+        return hash(job_id) & (self._NUM_SHARDS - 1)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
     def create(self, config: VegChangeConfig) -> AnalysisJob:
         """Create a new job."""
-        job_id = str(uuid.uuid4())[:8]
+        # 8 URL-safe characters carrying 48 random bits; retry on the rare clash
+        job_id = secrets.token_urlsafe(6)
+        while self.get(job_id) is not None:
+            job_id = secrets.token_urlsafe(6)
         job = AnalysisJob(
             job_id=job_id,
             status=AnalysisStatus.PENDING,
             config=config,
         )
 
-        with self._lock:
-            # Cleanup old jobs if needed
-            self._cleanup_old_jobs()
-            self._jobs[job_id] = job
+        # Cleanup old jobs if needed
+        if len(self) >= self._max_jobs:
+            with self._lock:
+                self._cleanup_old_jobs()
+
+        i = self._shard(job_id)
+        with self._locks[i]:
+            self._shards[i][job_id] = job
 
         return job
 
     def get(self, job_id: str) -> Optional[AnalysisJob]:
         """Get job by ID."""
-        with self._lock:
-            return self._jobs.get(job_id)
+        # A single dict lookup is atomic under the GIL
+        return self._shards[self._shard(job_id)].get(job_id)
 
     def update(self, job_id: str, **kwargs) -> Optional[AnalysisJob]:
-        """Update job fields."""
-        with self._lock:
-            job = self._jobs.get(job_id)
+        """Update job fields (unknown field names are ignored)."""
+        changes = {key: value for key, value in kwargs.items() if key in _JOB_FIELDS}
+        i = self._shard(job_id)
+        with self._locks[i]:
+            job = self._shards[i].get(job_id)
             if job:
-                for key, value in kwargs.items():
-                    if hasattr(job, key):
-                        setattr(job, key, value)
+                job.__dict__.update(changes)
             return job
 
     def delete(self, job_id: str) -> bool:
         """Delete a job."""
-        with self._lock:
-            if job_id in self._jobs:
-                del self._jobs[job_id]
-                return True
-            return False
+        i = self._shard(job_id)
+        with self._locks[i]:
+            return self._shards[i].pop(job_id, None) is not None
 
     def list_jobs(
         self,
         status: Optional[AnalysisStatus] = None,
         limit: int = 50,
     ) -> List[AnalysisJob]:
-        """List jobs, optionally filtered by status."""
-        with self._lock:
-            jobs = list(self._jobs.values())
+        """
+        List jobs, newest first, optionally filtered by status.
+
+        Each shard keeps its jobs in creation order, so the newest-first
+        view is a lazy merge of the reversed shards that stops as soon as
+        ``limit`` matches are found, without sorting the whole store.
+        """
+        jobs = []
+        if limit <= 0:
+            return jobs
 
-        if status:
-            jobs = [j for j in jobs if j.status == status]
+        snapshots = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                snapshots.append(list(reversed(shard.values())))
 
-        # Sort by created_at descending
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
+        newest_first = heapq.merge(
+            *snapshots, key=lambda j: j.created_at, reverse=True
+        )
+        for job in newest_first:
+            if status and job.status != status:
+                continue
+            jobs.append(job)
+            if len(jobs) == limit:
+                break
 
-        return jobs[:limit]
+        return jobs
 
     def _cleanup_old_jobs(self):
-        """Remove oldest completed jobs if over limit."""
-        if len(self._jobs) < self._max_jobs:
+        """Remove oldest completed jobs if over limit (caller holds ``_lock``)."""
+        total = len(self)
+        if total < self._max_jobs:
             return
 
         # Get completed jobs sorted by completion time
-        completed = [
-            (jid, job) for jid, job in self._jobs.items()
-            if job.status in (AnalysisStatus.COMPLETED, AnalysisStatus.FAILED)
-        ]
-        completed.sort(key=lambda x: x[1].completed_at or x[1].created_at)
+        completed = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                completed.extend(
+                    job for job in shard.values()
+                    if job.status in (AnalysisStatus.COMPLETED, AnalysisStatus.FAILED)
+                )
+        completed.sort(key=lambda job: job.completed_at or job.created_at)
 
         # Remove oldest completed jobs
-        to_remove = len(self._jobs) - self._max_jobs + 10
-        for jid, _ in completed[:to_remove]:
-            del self._jobs[jid]
+        to_remove = total - self._max_jobs + 10
+        for job in completed[:to_remove]:
+            i = self._shard(job.job_id)
+            with self._locks[i]:
+                self._shards[i].pop(job.job_id, None)
+
+
+# =============================================================================
+# ANALYSIS MEMOIZATION
+# =============================================================================
+
+# Default number of analyze() results kept per orchestrator
+ANALYSIS_CACHE_SIZE = 128
+
+# Progress updates for the same step closer together than this are dropped
+_PROGRESS_MIN_INTERVAL = 0.1
+
+# The cache is dropped when a window of lookups hits less often than this
+_CACHE_PRUNE_WINDOW = 1000
+_CACHE_PRUNE_MIN_HIT_RATIO = 0.3
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit/miss counters for the analyze() result cache.
+
+    Counters are updated under the orchestrator's cache lock. ``window_*``
+    counts cover the current pruning window only.
+    """
+    hits: int = 0
+    misses: int = 0
+    uncacheable: int = 0
+    evictions: int = 0
+    prunes: int = 0
+    window_hits: int = 0
+    window_lookups: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total keyed lookups (hits + misses)."""
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of keyed lookups served from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary for API responses."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "evictions": self.evictions,
+            "prunes": self.prunes,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+def _aoi_key(aoi: ee.Geometry) -> Optional[str]:
+    """
+    Content hash of an AOI from its client-side serialized graph.
+
+    No EE request is made. Returns None when the AOI cannot be serialized,
+    which disables caching for that call.
+    """
+    try:
+        return hashlib.blake2b(aoi.serialize().encode(), digest_size=16).hexdigest()
+    except (AttributeError, TypeError):
+        return None
+
+
+def _analysis_cache_key(
+    aoi_key: Optional[str],
+    periods: List[str],
+    indices: List[str],
+    reference_period: str,
+    config: VegChangeConfig,
+) -> Optional[tuple]:
+    """Build a content-addressed key for an analyze() call (None if unkeyable)."""
+    if aoi_key is None:
+        return None
+    key = (aoi_key, tuple(periods), tuple(indices), reference_period, config)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _copy_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the result dicts so callers can add keys without touching the cache."""
+    return {
+        name: dict(value) if isinstance(value, dict) else value
+        for name, value in results.items()
+    }
+
+
+# =============================================================================
+# SHARED COMPOSITE CACHE
+# =============================================================================
+
+# Composites (with and without index bands) are lazy EE graphs (kilobytes),
+# shared by analyze() and preview()
+_COMPOSITE_CACHE_SIZE = 64
+_composite_cache: "OrderedDict[tuple, ee.Image]" = OrderedDict()
+_composite_cache_lock = threading.Lock()
+_composite_cache_stats = CacheStats()
+
+
+def _period_info(period: str) -> tuple:
+    """Get (start, end, sensors) for a period, raising ValueError if unknown."""
+    try:
+        return _PERIOD_INFO_CACHE[period]
+    except KeyError:
+        raise ValueError(
+            f"Unknown period: {period}. Valid: {list(_PERIOD_INFO_CACHE)}"
+        ) from None
+
+
+def _fused_composite(
+    aoi: ee.Geometry,
+    aoi_key: Optional[str],
+    period: str,
+    cloud_threshold: float = 20.0,
+) -> ee.Image:
+    """
+    Get the fused composite for a period, reusing a cached graph if any.
+
+    Args:
+        aoi: Area of interest as ee.Geometry
+        aoi_key: Content hash from _aoi_key (None bypasses the cache)
+        period: Temporal period name
+        cloud_threshold: Maximum cloud cover percentage
+
+    Returns:
+        ee.Image composite
+    """
+    start_date, end_date, sensors = _period_info(period)
+    key = None
+    if aoi_key is not None:
+        key = (aoi_key, start_date, end_date, sensors, cloud_threshold)
+
+    return _cached_composite(key, lambda: create_fused_composite(
+        aoi=aoi,
+        start_date=start_date,
+        end_date=end_date,
+        sensors=list(sensors),
+        cloud_threshold=cloud_threshold,
+    ))
+
+
+def _indexed_composite(
+    composite: ee.Image,
+    aoi_key: Optional[str],
+    period: str,
+    indices: List[str],
+    cloud_threshold: float = 20.0,
+) -> ee.Image:
+    """
+    Add spectral index bands to a period composite, reusing a cached graph.
+
+    Args:
+        composite: Composite returned by _fused_composite for the same
+            AOI, period and cloud threshold
+        aoi_key: Content hash from _aoi_key (None bypasses the cache)
+        period: Temporal period name
+        indices: Spectral indices to add
+        cloud_threshold: Maximum cloud cover percentage
+
+    Returns:
+        ee.Image composite with index bands
+    """
+    key = None
+    if aoi_key is not None:
+        key = ("indices", aoi_key, period, cloud_threshold, tuple(indices))
+
+    return _cached_composite(key, lambda: add_all_indices(composite, indices=list(indices)))
+
+
+def _cached_composite(key: Optional[tuple], build) -> ee.Image:
+    """Return the cached image for ``key``, building and storing it on a miss."""
+    if key is None:
+        return build()
+
+    with _composite_cache_lock:
+        composite = _composite_cache.get(key)
+        if composite is not None:
+            _composite_cache.move_to_end(key)
+            _composite_cache_stats.hits += 1
+            return composite
+        _composite_cache_stats.misses += 1
+
+    composite = build()
+
+    with _composite_cache_lock:
+        _composite_cache[key] = composite
+        while len(_composite_cache) > _COMPOSITE_CACHE_SIZE:
+            _composite_cache.popitem(last=False)
+            _composite_cache_stats.evictions += 1
+
+    return composite
+
+
+# =============================================================================
+# EE REQUESTS
+# =============================================================================
+
+def _evaluate_statistics(
+    statistics: Dict[str, ee.Dictionary],
+    scale: int = 30,
+) -> Dict[str, Any]:
+    """
+    Fetch the statistics of every comparison in a single request.
+
+    The per-comparison dictionaries are combined into one deferred
+    ee.Dictionary so only one getInfo() round trip is made; each
+    histogram is then summarized into areas and percentages per class.
+    """
+    if not statistics:
+        return {}
+    evaluated = ee.Dictionary(statistics).getInfo()
+    return {
+        name: summarize_class_histogram(stats.get("change_class") or {}, scale=scale)
+        for name, stats in evaluated.items()
+    }
 
 
 # =============================================================================
@@ -212,14 +515,64 @@ class ChangeOrchestrator:
         >>> job = orchestrator.get_job(job_id)
     """
 
-    def __init__(self, job_store: Optional[JobStore] = None):
+    def __init__(
+        self,
+        job_store: Optional[JobStore] = None,
+        cache_size: int = ANALYSIS_CACHE_SIZE,
+    ):
         """
         Initialize orchestrator.
 
         Args:
             job_store: Optional custom job store (creates default if None)
+            cache_size: Number of analyze() results to memoize (0 disables)
         """
         self.job_store = job_store or JobStore()
+        self._cache_size = cache_size
+        self._results_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_stats = CacheStats()
+
+    def clear_cache(self) -> None:
+        """Drop all memoized analysis results."""
+        with self._cache_lock:
+            self._results_cache.clear()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get analyze() cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters, hit ratio, and current size,
+            plus the same breakdown for the shared composite cache
+        """
+        with self._cache_lock:
+            stats = self._cache_stats.to_dict()
+            stats["size"] = len(self._results_cache)
+            stats["max_size"] = self._cache_size
+        with _composite_cache_lock:
+            stats["composites"] = _composite_cache_stats.to_dict()
+            stats["composites"]["size"] = len(_composite_cache)
+            stats["composites"]["max_size"] = _COMPOSITE_CACHE_SIZE
+        return stats
+
+    def _record_lookup(self, hit: bool) -> None:
+        """Count a cache lookup and prune the cache if it is not paying off."""
+        stats = self._cache_stats
+        if hit:
+            stats.hits += 1
+            stats.window_hits += 1
+        else:
+            stats.misses += 1
+        stats.window_lookups += 1
+
+        if stats.window_lookups >= _CACHE_PRUNE_WINDOW:
+            if stats.window_hits / stats.window_lookups < _CACHE_PRUNE_MIN_HIT_RATIO:
+                stats.evictions += len(self._results_cache)
+                stats.prunes += 1
+                self._results_cache.clear()
+            stats.window_hits = 0
+            stats.window_lookups = 0
 
     # -------------------------------------------------------------------------
     # SYNCHRONOUS ANALYSIS METHODS
@@ -237,6 +590,11 @@ class ChangeOrchestrator:
         """
         Run vegetation change analysis on an area of interest.
 
+        Results are memoized per (AOI, periods, indices, reference period,
+        config), so repeated identical requests reuse the EE computation
+        graph instead of rebuilding it. The cached objects are lazy EE
+        graphs, so they are still evaluated against current data.
+
         Args:
             aoi: Area of interest as ee.Geometry
             periods: List of temporal periods to analyze
@@ -261,24 +619,47 @@ class ChangeOrchestrator:
             if progress_callback:
                 progress_callback(progress, step)
 
+        aoi_key = _aoi_key(aoi)
+        cache_key = None
+        if self._cache_size > 0:
+            cache_key = _analysis_cache_key(aoi_key, periods, indices, reference_period, config)
+            if cache_key is None:
+                with self._cache_lock:
+                    self._cache_stats.uncacheable += 1
+
+        if cache_key is not None:
+            with self._cache_lock:
+                cached = self._results_cache.get(cache_key)
+                if cached is not None:
+                    self._results_cache.move_to_end(cache_key)
+                self._record_lookup(hit=cached is not None)
+            if cached is not None:
+                update_progress(1.0, "Analysis complete (cached)")
+                return _copy_results(cached)
+
         update_progress(0.0, "Starting analysis")
 
         # Step 1: Create temporal composites (0-40%)
         update_progress(0.05, "Creating temporal composites")
-        composites = create_all_period_composites(
-            aoi=aoi,
-            periods=periods,
-            cloud_threshold=config.cloud_threshold,
-        )
+        composites = {
+            period_name: _fused_composite(
+                aoi, aoi_key, period_name, config.cloud_threshold
+            )
+            for period_name in periods
+        }
         update_progress(0.40, "Composites created")
 
         # Step 2: Add spectral indices (40-60%)
+        # Graph construction only (no EE requests), so this stays serial.
+        # The period tag goes on after the cached lookup, so analyze and
+        # preview share identical cache entries.
         update_progress(0.45, "Calculating spectral indices")
-        for period_name in composites:
-            composites[period_name] = add_all_indices(
-                composites[period_name],
-                indices=indices,
-            )
+        composites = {
+            period_name: _indexed_composite(
+                composite, aoi_key, period_name, indices, config.cloud_threshold
+            ).set("period", period_name)
+            for period_name, composite in composites.items()
+        }
         update_progress(0.60, "Indices calculated")
 
         # Step 3: Create change analysis (60-85%)
@@ -291,25 +672,35 @@ class ChangeOrchestrator:
         update_progress(0.85, "Change analysis complete")
 
         # Step 4: Generate statistics (85-100%)
-        update_progress(0.90, "Generating statistics")
-        statistics = {}
-        for comparison_name, change_image in changes.items():
-            stats = generate_change_statistics(
-                change_image=change_image,
+        # Single-period runs produce no comparisons, so there is nothing to reduce
+        if changes:
+            update_progress(0.90, "Generating statistics")
+            statistics = generate_batched_change_statistics(
+                change_images=changes,
                 aoi=aoi,
                 scale=config.export_scale,
             )
-            statistics[comparison_name] = stats
-
-        update_progress(1.0, "Analysis complete")
+            update_progress(1.0, "Analysis complete")
+        else:
+            statistics = {}
+            update_progress(1.0, "Analysis complete (no change comparisons)")
 
-        return {
+        results = {
             "composites": composites,
             "changes": changes,
             "statistics": statistics,
             "config": config,
         }
 
+        if cache_key is not None:
+            with self._cache_lock:
+                self._results_cache[cache_key] = _copy_results(results)
+                while len(self._results_cache) > self._cache_size:
+                    self._results_cache.popitem(last=False)
+                    self._cache_stats.evictions += 1
+
+        return results
+
     def analyze_from_file(
         self,
         aoi_path: str,
@@ -341,6 +732,19 @@ class ChangeOrchestrator:
         Returns:
             Dictionary with analysis results and export tasks
         """
+        from engine.io.aoi import (
+            load_aoi,
+            aoi_to_ee_geometry,
+            create_buffered_aoi,
+            get_aoi_centroid,
+            get_aoi_area,
+        )
+        from engine.io.exporters import (
+            export_all_composites,
+            export_all_changes,
+            ExportConfig,
+        )
+
         # Initialize configuration
         if config is None:
             config = VegChangeConfig(
@@ -400,7 +804,7 @@ class ChangeOrchestrator:
                 prefix=f"veg_{site_name.lower().replace(' ', '_')}",
             )
 
-            # Export composites
+            # Export composites; the exporters start their tasks concurrently
             composite_tasks = export_all_composites(
                 composites=results["composites"],
                 region=aoi,
@@ -446,26 +850,25 @@ class ChangeOrchestrator:
 
         Returns:
             ee.Image composite with index band
+
+        Raises:
+            ValueError: If period is not a known temporal period
         """
+        # Validate period before any AOI work, so bad input fails fast
+        _period_info(period)
+
+        from engine.io.aoi import load_aoi, aoi_to_ee_geometry
+
         # Load AOI
         gdf = load_aoi(aoi_path)
         aoi = aoi_to_ee_geometry(gdf)
 
-        # Get period info
-        period_info = TEMPORAL_PERIODS[period]
-
-        # Create composite
-        composite = create_fused_composite(
-            aoi=aoi,
-            start_date=period_info["start"],
-            end_date=period_info["end"],
-            sensors=period_info["sensors"],
-        )
+        # Create composite (shared with analyze() for the same AOI/period)
+        aoi_key = _aoi_key(aoi)
+        composite = _fused_composite(aoi, aoi_key, period)
 
         # Add index
-        composite = add_all_indices(composite, [index])
-
-        return composite
+        return _indexed_composite(composite, aoi_key, period, [index])
 
     # -------------------------------------------------------------------------
     # JOB-BASED METHODS (for API)
@@ -484,6 +887,29 @@ class ChangeOrchestrator:
         job = self.job_store.create(config)
         return job.job_id
 
+    def _job_progress_callback(self, job_id: str):
+        """
+        Build a debounced progress callback that writes to the job store.
+
+        An update is stored when the step changes, when progress reaches
+        1.0, or when ``_PROGRESS_MIN_INTERVAL`` has passed since the last
+        stored update; other ticks are dropped. Terminal states are always
+        written separately by the caller.
+        """
+        update_job = self.job_store.update
+        last_time = 0.0
+        last_step = None
+
+        def progress_callback(progress: float, step: str):
+            nonlocal last_time, last_step
+            now = time.monotonic()
+            if step != last_step or progress >= 1.0 or now - last_time >= _PROGRESS_MIN_INTERVAL:
+                update_job(job_id, progress=progress, current_step=step)
+                last_time = now
+                last_step = step
+
+        return progress_callback
+
     def get_job(self, job_id: str) -> Optional[AnalysisJob]:
         """
         Get job by ID.
@@ -520,17 +946,12 @@ class ChangeOrchestrator:
         self.job_store.update(
             job_id,
             status=AnalysisStatus.RUNNING,
-            started_at=datetime.utcnow(),
+            started_at=time.time(),
         )
 
         try:
             # Progress callback updates job
-            def progress_callback(progress: float, step: str):
-                self.job_store.update(
-                    job_id,
-                    progress=progress,
-                    current_step=step,
-                )
+            progress_callback = self._job_progress_callback(job_id)
 
             # Run analysis
             results = self.analyze(
@@ -544,14 +965,16 @@ class ChangeOrchestrator:
 
             # Store results (convert ee objects to serializable format)
             serializable_results = {
-                "statistics": results.get("statistics"),
+                "statistics": _evaluate_statistics(
+                    results.get("statistics"), scale=results["config"].export_scale
+                ),
                 "config": job.config.to_dict() if hasattr(job.config, "to_dict") else None,
             }
 
             self.job_store.update(
                 job_id,
                 status=AnalysisStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
+                completed_at=time.time(),
                 progress=1.0,
                 current_step="Complete",
                 results=serializable_results,
@@ -561,7 +984,7 @@ class ChangeOrchestrator:
             self.job_store.update(
                 job_id,
                 status=AnalysisStatus.FAILED,
-                completed_at=datetime.utcnow(),
+                completed_at=time.time(),
                 error=str(e),
             )
             raise
@@ -592,17 +1015,12 @@ class ChangeOrchestrator:
         self.job_store.update(
             job_id,
             status=AnalysisStatus.RUNNING,
-            started_at=datetime.utcnow(),
+            started_at=time.time(),
         )
 
         try:
             # Progress callback updates job
-            def progress_callback(progress: float, step: str):
-                self.job_store.update(
-                    job_id,
-                    progress=progress,
-                    current_step=step,
-                )
+            progress_callback = self._job_progress_callback(job_id)
 
             # Run analysis
             results = self.analyze_from_file(
@@ -620,7 +1038,9 @@ class ChangeOrchestrator:
 
             # Store serializable results
             serializable_results = {
-                "statistics": results.get("statistics"),
+                "statistics": _evaluate_statistics(
+                    results.get("statistics"), scale=results["config"].export_scale
+                ),
                 "aoi_centroid": results.get("aoi_centroid"),
                 "aoi_area_ha": results.get("aoi_area_ha"),
             }
@@ -628,7 +1048,7 @@ class ChangeOrchestrator:
             self.job_store.update(
                 job_id,
                 status=AnalysisStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
+                completed_at=time.time(),
                 progress=1.0,
                 current_step="Complete",
                 results=serializable_results,
@@ -638,7 +1058,7 @@ class ChangeOrchestrator:
             self.job_store.update(
                 job_id,
                 status=AnalysisStatus.FAILED,
-                completed_at=datetime.utcnow(),
+                completed_at=time.time(),
                 error=str(e),
             )
             raise
@@ -660,7 +1080,7 @@ class ChangeOrchestrator:
             self.job_store.update(
                 job_id,
                 status=AnalysisStatus.CANCELLED,
-                completed_at=datetime.utcnow(),
+                completed_at=time.time(),
             )
             return True
         return False
@@ -687,15 +1107,96 @@ class ChangeOrchestrator:
 # CONVENIENCE FUNCTIONS (backward compatibility with pipeline.py)
 # =============================================================================
 
+# Default selections as tuples: the analyze() cache key reuses them as-is
+_DEFAULT_PERIODS = tuple(DEFAULT_CONFIG.periods)
+_DEFAULT_INDICES = tuple(DEFAULT_CONFIG.indices)
+
 # Global orchestrator instance
 _orchestrator: Optional[ChangeOrchestrator] = None
+_orchestrator_lock = threading.Lock()
+
+# Per-context override (request, task or thread); see use_orchestrator
+_orchestrator_var: ContextVar[Optional[ChangeOrchestrator]] = ContextVar(
+    "_orchestrator", default=None
+)
+
+
+def _service_account_key() -> Optional[Tuple[str, str]]:
+    """Return (email, key file) from GOOGLE_APPLICATION_CREDENTIALS, if set."""
+    key_file = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+    if not key_file:
+        return None
+    try:
+        with open(key_file, "r") as f:
+            email = json.load(f).get("client_email")
+    except (OSError, ValueError):
+        return None
+    return (email, key_file) if email else None
+
+
+def _ensure_high_volume_ee():
+    """
+    Initialize Earth Engine against the high-volume endpoint.
+
+    The convenience functions fan out many concurrent requests per
+    analysis, which the latency-optimized default endpoint throttles.
+    Only non-interactive credentials are tried (a service account key
+    from GOOGLE_APPLICATION_CREDENTIALS, or persistent credentials).
+    Nothing is done without them, or when Earth Engine is already
+    initialized, by the platform initializer or by a direct
+    ``ee.Initialize(project=...)`` call whose project must be kept.
+    """
+    if is_ee_initialized() or getattr(ee.data, "_credentials", None) is not None:
+        return
+
+    service_account = _service_account_key()
+    if service_account is None and not has_persistent_credentials():
+        return
+
+    email, key_file = service_account or (None, None)
+    try:
+        initialize_ee(
+            service_account=email,
+            private_key_file=key_file,
+            use_high_volume=True,
+        )
+    except EEAuthenticationError:
+        # Surface the auth problem on the first EE request instead
+        pass
+
+
+@contextmanager
+def use_orchestrator(orchestrator: ChangeOrchestrator):
+    """
+    Route the convenience functions to ``orchestrator`` in this context.
+
+    The binding lives in a ContextVar, so it is scoped to the current
+    request, asyncio task or thread and restored on exit; other contexts
+    keep using the shared global instance.
+
+    Example:
+        >>> with use_orchestrator(ChangeOrchestrator(cache_size=0)):
+        ...     results = analyze_vegetation_change(aoi)
+    """
+    token = _orchestrator_var.set(orchestrator)
+    try:
+        yield orchestrator
+    finally:
+        _orchestrator_var.reset(token)
 
 
 def _get_orchestrator() -> ChangeOrchestrator:
-    """Get or create global orchestrator instance."""
+    """Get the context-bound orchestrator, or the global instance."""
+    orchestrator = _orchestrator_var.get()
+    if orchestrator is not None:
+        return orchestrator
+
     global _orchestrator
     if _orchestrator is None:
-        _orchestrator = ChangeOrchestrator()
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                _ensure_high_volume_ee()
+                _orchestrator = ChangeOrchestrator()
     return _orchestrator
 
 
@@ -722,6 +1223,10 @@ def analyze_vegetation_change(
         Dictionary with composites, changes, and statistics
     """
     orchestrator = _get_orchestrator()
+    if periods is None and indices is None and config is None:
+        return orchestrator.analyze(
+            aoi, _DEFAULT_PERIODS, _DEFAULT_INDICES, reference_period, DEFAULT_CONFIG
+        )
     return orchestrator.analyze(
         aoi=aoi,
         periods=periods,
@@ -797,10 +1302,23 @@ def quick_preview(
     )
 
 
+@lru_cache(maxsize=32)
+def _period_summary(periods: Tuple[str, ...]) -> Mapping[str, Mapping[str, Any]]:
+    """Build the (read-only) summary for a tuple of period names."""
+    return MappingProxyType({
+        period_name: _PERIOD_SUMMARY[period_name]
+        for period_name in periods
+        if period_name in _PERIOD_SUMMARY
+    })
+
+
 def get_period_summary(periods: Optional[List[str]] = None) -> Dict:
     """
     Get summary of temporal periods.
 
+    Summaries are memoized per period selection; each call returns a
+    fresh dict copy, so callers can serialize or extend it freely.
+
     Args:
         periods: List of period names (default: all)
 
@@ -808,17 +1326,9 @@ def get_period_summary(periods: Optional[List[str]] = None) -> Dict:
         Dictionary with period information
     """
     if periods is None:
-        periods = list(TEMPORAL_PERIODS.keys())
-
-    summary = {}
-    for period_name in periods:
-        if period_name in TEMPORAL_PERIODS:
-            info = TEMPORAL_PERIODS[period_name]
-            summary[period_name] = {
-                "start": info["start"],
-                "end": info["end"],
-                "sensors": info["sensors"],
-                "description": info["description"],
-            }
+        periods = _PERIOD_SUMMARY
 
-    return summary
+    return {
+        period_name: dict(info)
+        for period_name, info in _period_summary(tuple(periods)).items()
+    }
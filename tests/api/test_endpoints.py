@@ -8,18 +8,24 @@ Tests cover:
 - Error handling
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
 
 
 @pytest.fixture
-def client():
-    """Create test client with mocked EE."""
-    with patch("ee.Initialize"):
-        with patch("ee.data._initialized", True):
-            from app.api.main import app
-            return TestClient(app)
+def client(fastapi_app):
+    """Create test client around the session-wide app (EE mocked)."""
+    return TestClient(fastapi_app)
+
+
+@pytest.fixture(autouse=True)
+def mock_orch():
+    """Patch ChangeOrchestrator; tests configure ``mock_orch.return_value``."""
+    with patch("services.change_orchestrator.ChangeOrchestrator") as mock:
+        yield mock
 
 
 @pytest.mark.api
@@ -51,33 +57,31 @@ class TestHealthEndpoint:
 class TestAnalysisEndpoint:
     """Tests for analysis endpoints."""
 
-    def test_create_analysis_with_bbox(self, client, sample_bbox):
+    def test_create_analysis_with_bbox(self, client, mock_orch, sample_bbox):
         """Test creating analysis with bounding box."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.create_job.return_value = "test-job-123"
+        mock_orch.return_value.create_job.return_value = "test-job-123"
 
-            response = client.post("/analysis", json={
-                "site_name": "Test Site",
-                "bbox": sample_bbox,
-                "periods": ["1990s", "present"],
-                "indices": ["ndvi"]
-            })
+        response = client.post("/analysis", json={
+            "site_name": "Test Site",
+            "bbox": sample_bbox,
+            "periods": ["1990s", "present"],
+            "indices": ["ndvi"]
+        })
 
-            assert response.status_code in [200, 201, 202]
+        assert response.status_code in [200, 201, 202]
 
-    def test_create_analysis_with_geojson(self, client, sample_aoi_geojson):
+    def test_create_analysis_with_geojson(self, client, mock_orch, sample_aoi_geojson):
         """Test creating analysis with GeoJSON."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.create_job.return_value = "test-job-456"
+        mock_orch.return_value.create_job.return_value = "test-job-456"
 
-            response = client.post("/analysis", json={
-                "site_name": "GeoJSON Site",
-                "aoi_geojson": sample_aoi_geojson["geometry"],
-                "periods": ["1990s", "present"],
-                "indices": ["ndvi"]
-            })
+        response = client.post("/analysis", json={
+            "site_name": "GeoJSON Site",
+            "aoi_geojson": sample_aoi_geojson["geometry"],
+            "periods": ["1990s", "present"],
+            "indices": ["ndvi"]
+        })
 
-            assert response.status_code in [200, 201, 202]
+        assert response.status_code in [200, 201, 202]
 
     def test_create_analysis_missing_aoi_returns_error(self, client):
         """Test creating analysis without AOI returns error."""
@@ -116,96 +120,131 @@ class TestAnalysisEndpoint:
 class TestJobStatusEndpoint:
     """Tests for job status endpoint."""
 
-    def test_get_job_status(self, client):
+    def test_get_job_status(self, client, mock_orch):
         """Test getting job status."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.get_job.return_value = {
-                "job_id": "test-job-123",
-                "status": "running",
-                "progress": 0.5
-            }
+        mock_orch.return_value.get_job.return_value = {
+            "job_id": "test-job-123",
+            "status": "running",
+            "progress": 0.5
+        }
 
-            response = client.get("/analysis/test-job-123")
+        response = client.get("/analysis/test-job-123")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "status" in data
+        assert response.status_code == 200
+        data = response.json()
+        assert "status" in data
 
-    def test_get_nonexistent_job_returns_404(self, client):
+    def test_get_nonexistent_job_returns_404(self, client, mock_orch):
         """Test getting nonexistent job returns 404."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.get_job.return_value = None
+        mock_orch.return_value.get_job.return_value = None
 
-            response = client.get("/analysis/nonexistent-job")
+        response = client.get("/analysis/nonexistent-job")
 
-            assert response.status_code == 404
+        assert response.status_code == 404
 
-    def test_get_completed_job_includes_results(self, client, sample_statistics):
+    def test_get_completed_job_includes_results(self, client, mock_orch, sample_statistics):
         """Test completed job includes results."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.get_job.return_value = {
-                "job_id": "completed-job",
-                "status": "completed",
-                "progress": 1.0,
-                "results": {
-                    "statistics": sample_statistics
-                }
+        mock_orch.return_value.get_job.return_value = {
+            "job_id": "completed-job",
+            "status": "completed",
+            "progress": 1.0,
+            "results": {
+                "statistics": sample_statistics
             }
+        }
+
+        response = client.get("/analysis/completed-job")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert "results" in data
+
+
+@pytest.mark.api
+class TestJobStatisticsEndpoint:
+    """Tests for the streamed job statistics endpoint."""
+
+    def test_get_statistics_nonexistent_job_returns_404(self, client):
+        """Test statistics of nonexistent job returns 404."""
+        response = client.get("/analysis/nonexistent-job/statistics")
+
+        assert response.status_code == 404
+
+    def test_stream_statistics_is_valid_json(self, sample_statistics):
+        """Test streamed chunks join into the full statistics document."""
+        import json
+        from app.api.routes.analysis import stream_statistics
+
+        statistics = {"1990s_to_present": sample_statistics, "2000s_to_present": {}}
+        body = b"".join(stream_statistics(statistics))
 
-            response = client.get("/analysis/completed-job")
+        assert json.loads(body) == {"statistics": statistics}
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "completed"
-            assert "results" in data
+    def test_stream_statistics_empty(self):
+        """Test streaming with no comparisons."""
+        import json
+        from app.api.routes.analysis import stream_statistics
+
+        assert json.loads(b"".join(stream_statistics({}))) == {"statistics": {}}
 
 
 @pytest.mark.api
 class TestListJobsEndpoint:
     """Tests for listing jobs endpoint."""
 
-    def test_list_jobs(self, client):
+    @pytest.mark.asyncio
+    async def test_list_jobs(self, async_client, mock_orch):
         """Test listing all jobs."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.list_jobs.return_value = [
-                {"job_id": "job-1", "status": "completed"},
-                {"job_id": "job-2", "status": "running"}
-            ]
+        mock_orch.return_value.list_jobs.return_value = [
+            {"job_id": "job-1", "status": "completed"},
+            {"job_id": "job-2", "status": "running"}
+        ]
 
-            response = client.get("/analysis")
+        response = await async_client.get("/analysis")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "jobs" in data or isinstance(data, list)
+        assert response.status_code == 200
+        data = response.json()
+        assert "jobs" in data or isinstance(data, list)
 
-    def test_list_jobs_with_status_filter(self, client):
+    @pytest.mark.asyncio
+    async def test_list_jobs_with_status_filter(self, async_client, mock_orch):
         """Test listing jobs with status filter."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.list_jobs.return_value = [
-                {"job_id": "job-1", "status": "completed"}
-            ]
+        mock_orch.return_value.list_jobs.return_value = [
+            {"job_id": "job-1", "status": "completed"}
+        ]
 
-            response = client.get("/analysis?status=completed")
+        response = await async_client.get("/analysis?status=completed")
+
+        assert response.status_code == 200
 
-            assert response.status_code == 200
+    @pytest.mark.asyncio
+    async def test_list_jobs_concurrent_requests(self, async_client):
+        """Test concurrent list requests with every status filter."""
+        statuses = ["pending", "running", "completed", "failed", "cancelled"]
+
+        responses = await asyncio.gather(*[
+            async_client.get(f"/analysis?status={status}") for status in statuses
+        ])
+
+        assert [r.status_code for r in responses] == [200] * len(statuses)
 
 
 @pytest.mark.api
 class TestPreviewEndpoint:
     """Tests for quick preview endpoint."""
 
-    def test_preview_endpoint(self, client, sample_bbox):
+    def test_preview_endpoint(self, client, mock_orch, sample_bbox):
         """Test preview endpoint."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.preview.return_value = MagicMock()
+        mock_orch.return_value.preview.return_value = MagicMock()
 
-            response = client.post("/analysis/preview", json={
-                "bbox": sample_bbox,
-                "period": "present",
-                "index": "ndvi"
-            })
+        response = client.post("/analysis/preview", json={
+            "bbox": sample_bbox,
+            "period": "present",
+            "index": "ndvi"
+        })
 
-            assert response.status_code in [200, 201]
+        assert response.status_code in [200, 201]
 
 
 @pytest.mark.api
@@ -245,24 +284,22 @@ class TestMetadataEndpoints:
 class TestCancelJobEndpoint:
     """Tests for job cancellation endpoint."""
 
-    def test_cancel_pending_job(self, client):
+    def test_cancel_pending_job(self, client, mock_orch):
         """Test canceling a pending job."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.cancel_job.return_value = True
+        mock_orch.return_value.cancel_job.return_value = True
 
-            response = client.delete("/analysis/pending-job")
+        response = client.delete("/analysis/pending-job")
 
-            assert response.status_code in [200, 204]
+        assert response.status_code in [200, 204]
 
-    def test_cancel_running_job_returns_conflict(self, client):
+    def test_cancel_running_job_returns_conflict(self, client, mock_orch):
         """Test canceling a running job may return conflict."""
-        with patch("services.change_orchestrator.ChangeOrchestrator") as mock_orch:
-            mock_orch.return_value.cancel_job.return_value = False
+        mock_orch.return_value.cancel_job.return_value = False
 
-            response = client.delete("/analysis/running-job")
+        response = client.delete("/analysis/running-job")
 
-            # May return 409 Conflict or 200 depending on implementation
-            assert response.status_code in [200, 204, 409]
+        # May return 409 Conflict or 200 depending on implementation
+        assert response.status_code in [200, 204, 409]
 
 
 @pytest.mark.api
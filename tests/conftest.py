@@ -8,6 +8,8 @@ This module provides:
 - Test configuration
 """
 
+import copy
+import importlib
 import json
 import os
 import sys
@@ -17,6 +19,13 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+# orjson is optional; fall back to the stdlib encoder
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -49,51 +58,118 @@ def pytest_collection_modifyitems(config, items):
 # Earth Engine Mocks
 # =============================================================================
 
+def _build_mock_ee() -> MagicMock:
+    """Build the mock Earth Engine module tree."""
+    ee = MagicMock()
+
+    # Mock basic EE objects
+    ee.Initialize = MagicMock()
+    ee.Geometry.Rectangle = MagicMock(return_value=Mock())
+    ee.Geometry.Point = MagicMock(return_value=Mock())
+    ee.Geometry.Polygon = MagicMock(return_value=Mock())
+
+    # Mock Image
+    mock_image = MagicMock()
+    mock_image.select.return_value = mock_image
+    mock_image.add.return_value = mock_image
+    mock_image.subtract.return_value = mock_image
+    mock_image.multiply.return_value = mock_image
+    mock_image.divide.return_value = mock_image
+    mock_image.rename.return_value = mock_image
+    mock_image.addBands.return_value = mock_image
+    mock_image.bandNames.return_value.getInfo.return_value = [
+        "blue", "green", "red", "nir", "swir1", "swir2"
+    ]
+    ee.Image = MagicMock(return_value=mock_image)
+
+    # Mock ImageCollection
+    mock_collection = MagicMock()
+    mock_collection.filterBounds.return_value = mock_collection
+    mock_collection.filterDate.return_value = mock_collection
+    mock_collection.filter.return_value = mock_collection
+    mock_collection.map.return_value = mock_collection
+    mock_collection.median.return_value = mock_image
+    mock_collection.size.return_value.getInfo.return_value = 10
+    ee.ImageCollection = MagicMock(return_value=mock_collection)
+
+    # Mock Reducer
+    ee.Reducer.mean = MagicMock()
+    ee.Reducer.sum = MagicMock()
+    ee.Reducer.count = MagicMock()
+    ee.Reducer.histogram = MagicMock()
+
+    return ee
+
+
+@pytest.fixture(scope="session")
+def _mock_ee_template():
+    """Mock EE tree built once per session and reset between tests."""
+    ee = _build_mock_ee()
+    return ee, ee.Image.return_value, ee.ImageCollection.return_value
+
+
 @pytest.fixture
-def mock_ee():
+def mock_ee(_mock_ee_template):
     """Mock Earth Engine module for unit tests."""
-    with patch.dict("sys.modules", {"ee": MagicMock()}):
-        import ee
-
-        # Mock basic EE objects
-        ee.Initialize = MagicMock()
-        ee.Geometry.Rectangle = MagicMock(return_value=Mock())
-        ee.Geometry.Point = MagicMock(return_value=Mock())
-        ee.Geometry.Polygon = MagicMock(return_value=Mock())
-
-        # Mock Image
-        mock_image = MagicMock()
-        mock_image.select.return_value = mock_image
-        mock_image.add.return_value = mock_image
-        mock_image.subtract.return_value = mock_image
-        mock_image.multiply.return_value = mock_image
-        mock_image.divide.return_value = mock_image
-        mock_image.rename.return_value = mock_image
-        mock_image.addBands.return_value = mock_image
-        mock_image.bandNames.return_value.getInfo.return_value = [
-            "blue", "green", "red", "nir", "swir1", "swir2"
-        ]
-        ee.Image = MagicMock(return_value=mock_image)
-
-        # Mock ImageCollection
-        mock_collection = MagicMock()
-        mock_collection.filterBounds.return_value = mock_collection
-        mock_collection.filterDate.return_value = mock_collection
-        mock_collection.filter.return_value = mock_collection
-        mock_collection.map.return_value = mock_collection
-        mock_collection.median.return_value = mock_image
-        mock_collection.size.return_value.getInfo.return_value = 10
-        ee.ImageCollection = MagicMock(return_value=mock_collection)
-
-        # Mock Reducer
-        ee.Reducer.mean = MagicMock()
-        ee.Reducer.sum = MagicMock()
-        ee.Reducer.count = MagicMock()
-        ee.Reducer.histogram = MagicMock()
+    ee, mock_image, mock_collection = _mock_ee_template
+
+    # Clear call state and side effects; keep the configured return values
+    ee.reset_mock(return_value=False, side_effect=True)
+    # Undo per-test rewiring of the top-level constructors and ee.data
+    ee.Image.return_value = mock_image
+    ee.ImageCollection.return_value = mock_collection
+    ee.data = MagicMock()
 
+    with patch.dict("sys.modules", {"ee": ee}):
         yield ee
 
 
+@pytest.fixture(scope="session")
+def _mock_pool() -> Dict[str, MagicMock]:
+    """MagicMocks shared across the session, keyed by shape name."""
+    return {}
+
+
+@pytest.fixture
+def make_mock(_mock_pool):
+    """
+    Factory returning a reusable MagicMock per shape name.
+
+    Mocks are built once per session and fully reset (calls, return
+    values, side effects) the first time a test asks for them, so a
+    test sees a fresh mock; within one test a name maps to one mock.
+    """
+    used = set()
+
+    def factory(shape: str = "plain") -> MagicMock:
+        mock = _mock_pool.get(shape)
+        if mock is None:
+            mock = _mock_pool[shape] = MagicMock()
+        elif shape not in used:
+            mock.reset_mock(return_value=True, side_effect=True)
+        used.add(shape)
+        return mock
+
+    return factory
+
+
+@pytest.fixture
+def make_change_map(make_mock):
+    """
+    Factory returning a change map whose ``reduceRegion().getInfo()``
+    yields ``result``.
+
+    The pooled ``change_map`` mock keeps its child chain between tests,
+    so only the leaf return value is rewired per call.
+    """
+    def factory(result: Dict[str, Any]) -> MagicMock:
+        change_map = make_mock("change_map")
+        change_map.reduceRegion.return_value.getInfo.return_value = result
+        return change_map
+
+    return factory
+
+
 @pytest.fixture
 def mock_ee_initialized(mock_ee):
     """Mock EE that's already initialized."""
@@ -135,17 +211,20 @@ def sample_bbox() -> Dict[str, float]:
     }
 
 
+_SAMPLE_ANALYSIS_CONFIG: Dict[str, Any] = {
+    "site_name": "Test Site",
+    "periods": ["1990s", "present"],
+    "indices": ["ndvi", "nbr"],
+    "reference_period": "1990s",
+    "cloud_threshold": 20.0,
+    "export_scale": 30
+}
+
+
 @pytest.fixture
 def sample_analysis_config() -> Dict[str, Any]:
     """Sample analysis configuration."""
-    return {
-        "site_name": "Test Site",
-        "periods": ["1990s", "present"],
-        "indices": ["ndvi", "nbr"],
-        "reference_period": "1990s",
-        "cloud_threshold": 20.0,
-        "export_scale": 30
-    }
+    return copy.deepcopy(_SAMPLE_ANALYSIS_CONFIG)
 
 
 @pytest.fixture
@@ -179,18 +258,17 @@ def sample_statistics() -> Dict[str, Any]:
 def temp_geojson_file(tmp_path, sample_aoi_geojson) -> Path:
     """Create a temporary GeoJSON file."""
     filepath = tmp_path / "test_aoi.geojson"
-    with open(filepath, "w") as f:
-        json.dump(sample_aoi_geojson, f)
+    filepath.write_bytes(_json_dumps(sample_aoi_geojson))
     return filepath
 
 
-@pytest.fixture
-def temp_config_file(tmp_path, sample_analysis_config) -> Path:
-    """Create a temporary config file."""
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory) -> Path:
+    """Create a temporary config file, written once per session (read-only)."""
     import yaml
-    filepath = tmp_path / "config.yaml"
+    filepath = tmp_path_factory.mktemp("config") / "config.yaml"
     with open(filepath, "w") as f:
-        yaml.dump(sample_analysis_config, f)
+        yaml.dump(_SAMPLE_ANALYSIS_CONFIG, f)
     return filepath
 
 
@@ -198,15 +276,36 @@ def temp_config_file(tmp_path, sample_analysis_config) -> Path:
 # API Testing Fixtures
 # =============================================================================
 
+@pytest.fixture(scope="session")
+def fastapi_app(request):
+    """Import the FastAPI app once per session with EE mocked out."""
+    module = sys.modules.get("app.api.main")
+    if module is None:
+        patcher = patch.dict("sys.modules", {"ee": MagicMock()})
+        patcher.start()
+        request.addfinalizer(patcher.stop)
+        module = importlib.import_module("app.api.main")
+
+    return module.app
+
+
 @pytest.fixture
-def api_client():
+def api_client(fastapi_app):
     """Create FastAPI test client."""
     from fastapi.testclient import TestClient
 
-    # Mock EE before importing app
-    with patch("ee.Initialize"):
-        from app.api.main import app
-        client = TestClient(app)
+    return TestClient(fastapi_app)
+
+
+@pytest.fixture
+async def async_client(fastapi_app):
+    """Create async client that drives the app in-process via ASGI."""
+    import httpx
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fastapi_app),
+        base_url="http://test",
+    ) as client:
         yield client
 
 
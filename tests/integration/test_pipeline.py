@@ -8,7 +8,9 @@ Run with: pytest tests/integration/ -v -m integration
 Skip with: pytest -m "not integration"
 """
 
+import json
 import pytest
+from collections.abc import Mapping
 from unittest.mock import MagicMock, patch
 
 
@@ -138,7 +140,8 @@ class TestCompositeCreation:
             periods=list(TEMPORAL_PERIODS.keys())
         )
 
-        assert isinstance(composites, dict)
+        assert isinstance(composites, Mapping)
+        assert set(composites) == set(TEMPORAL_PERIODS)
 
     def test_composite_has_all_bands(self, mock_ee):
         """Test composite has all expected bands."""
@@ -235,3 +238,57 @@ class TestExportWorkflow:
 
         assert composite_tasks is not None or mock_ee.batch.Export.called
         assert change_tasks is not None or mock_ee.batch.Export.called
+
+
+@pytest.mark.integration
+class TestHighVolumeInitialization:
+    """Integration tests for the convenience functions' EE initialization."""
+
+    def test_externally_initialized_ee_is_not_reinitialized(self, mock_ee, tmp_path):
+        """Test a caller's own ee.Initialize(project=...) is left in place."""
+        from engine import ee_init
+        from services import change_orchestrator
+
+        mock_ee.data._credentials = MagicMock()
+        creds_path = tmp_path / "credentials"
+        creds_path.write_text("{}")
+
+        with patch.object(change_orchestrator, "_orchestrator", None), \
+                patch.object(ee_init, "_CREDS_PATH", str(creds_path)), \
+                patch.object(change_orchestrator, "_service_account_key", return_value=None):
+            change_orchestrator._get_orchestrator()
+
+        assert not mock_ee.Initialize.called
+
+    def test_uninitialized_ee_uses_high_volume_endpoint(self, mock_ee, tmp_path):
+        """Test persistent credentials are used against the high-volume URL."""
+        from engine import ee_init
+        from services import change_orchestrator
+
+        mock_ee.data._credentials = None
+        creds_path = tmp_path / "credentials"
+        creds_path.write_text("{}")
+
+        with patch.object(change_orchestrator, "_orchestrator", None), \
+                patch.object(ee_init, "_CREDS_PATH", str(creds_path)), \
+                patch.object(change_orchestrator, "_service_account_key", return_value=None):
+            change_orchestrator._get_orchestrator()
+
+        mock_ee.Initialize.assert_called_once()
+        assert "highvolume" in mock_ee.Initialize.call_args.kwargs["opt_url"]
+
+
+@pytest.mark.integration
+class TestPeriodSummary:
+    """Integration tests for the period summary helper."""
+
+    def test_period_summary_is_plain_json_serializable_dict(self, mock_ee):
+        """Test the memoized summary comes back as independent plain dicts."""
+        from services.change_orchestrator import get_period_summary
+
+        summary = get_period_summary(["1990s", "present"])
+        summary["1990s"]["note"] = "caller-owned"
+
+        assert type(summary) is dict and type(summary["present"]) is dict
+        assert json.loads(json.dumps(summary))["present"]["start"]
+        assert "note" not in get_period_summary(["1990s", "present"])["1990s"]
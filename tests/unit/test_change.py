@@ -9,34 +9,31 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, patch, sentinel
 
 
 class TestChangeClassification:
     """Tests for change classification logic."""
 
-    def test_classify_change_returns_5_classes(self, mock_ee):
-        """Test change classification produces 5 classes."""
-        from engine.change import classify_change
-
-        mock_delta = MagicMock()
-
-        result = classify_change(
-            delta_image=mock_delta,
-            index="ndvi"
-        )
-
-        # Should produce classified image
-        assert result is not None
-
-    def test_classify_change_uses_thresholds(self, mock_ee):
-        """Test classification uses correct thresholds."""
+    @pytest.mark.parametrize("thresholds", [
+        pytest.param(None, id="returns_5_classes"),
+        pytest.param("config", id="uses_config_thresholds"),
+        pytest.param({
+            "strong_loss": -0.20,
+            "moderate_loss": -0.10,
+            "moderate_gain": 0.10,
+            "strong_gain": 0.20
+        }, id="custom_thresholds"),
+    ])
+    def test_classify_change(self, mock_ee, make_mock, thresholds):
+        """Test change classification produces a classified image."""
         from engine.change import classify_change
-        from engine.change.thresholds import CHANGE_THRESHOLDS
 
-        mock_delta = MagicMock()
+        if thresholds == "config":
+            from engine.change.thresholds import CHANGE_THRESHOLDS
+            thresholds = CHANGE_THRESHOLDS.get("ndvi", {})
 
-        thresholds = CHANGE_THRESHOLDS.get("ndvi", {})
+        mock_delta = make_mock("delta")
 
         result = classify_change(
             delta_image=mock_delta,
@@ -46,25 +43,16 @@ class TestChangeClassification:
 
         assert result is not None
 
-    def test_custom_thresholds(self, mock_ee):
-        """Test classification with custom thresholds."""
-        from engine.change import classify_change
+    def test_threshold_classifier_single_expression(self, mock_ee, make_mock):
+        """Test classification builds one expression node, no where() chain."""
+        from engine.change.thresholds import ChangeThresholds, ThresholdClassifier
 
-        mock_delta = MagicMock()
-        custom_thresholds = {
-            "strong_loss": -0.20,
-            "moderate_loss": -0.10,
-            "moderate_gain": 0.10,
-            "strong_gain": 0.20
-        }
+        mock_delta = make_mock("delta")
 
-        result = classify_change(
-            delta_image=mock_delta,
-            index="ndvi",
-            thresholds=custom_thresholds
-        )
+        ThresholdClassifier(ChangeThresholds.from_config("ndvi")).classify(mock_delta)
 
-        assert result is not None
+        assert mock_delta.expression.call_count == 1
+        assert not mock_ee.Image.constant.called
 
 
 class TestChangeThresholds:
@@ -97,32 +85,49 @@ class TestChangeThresholds:
 
     def test_threshold_ordering(self, mock_ee):
         """Test thresholds are in correct order."""
-        from engine.change.thresholds import CHANGE_THRESHOLDS
+        from engine.change.thresholds import CHANGE_THRESHOLDS, ChangeThresholds
+
+        for index_name in CHANGE_THRESHOLDS:
+            t = ChangeThresholds.from_config(index_name[1:])
+
+            assert t.strong_loss < t.moderate_loss < t.moderate_gain < t.strong_gain
+
+    def test_thresholds_are_frozen(self, mock_ee):
+        """Test ChangeThresholds is immutable and hashable."""
+        import dataclasses
+        from engine.change.thresholds import ChangeThresholds
 
-        for index_name, thresholds in CHANGE_THRESHOLDS.items():
-            assert thresholds["strong_loss"] < thresholds["moderate_loss"]
-            assert thresholds["moderate_loss"] < thresholds["moderate_gain"]
-            assert thresholds["moderate_gain"] < thresholds["strong_gain"]
+        thresholds = ChangeThresholds.from_config("ndvi")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            thresholds.strong_loss = -1.0
+
+        assert hash(thresholds) == hash(ChangeThresholds.from_config("ndvi"))
+
+    def test_from_config_is_cached(self, mock_ee):
+        """Test default thresholds are built once per index and shared."""
+        from engine.change.thresholds import ChangeThresholds
+
+        assert ChangeThresholds.from_config("nbr") is ChangeThresholds.from_config("nbr")
+        assert ChangeThresholds.from_config("nbr") != ChangeThresholds.from_config("ndvi")
 
 
 class TestChangeStatistics:
     """Tests for change statistics generation."""
 
-    def test_generate_statistics_returns_dict(self, mock_ee):
+    def test_generate_statistics_returns_dict(self, mock_ee, make_change_map):
         """Test statistics generation returns dictionary."""
         from engine.change import generate_change_statistics
 
-        mock_change_map = MagicMock()
-        mock_aoi = MagicMock()
-
         # Mock the reduceRegion result
-        mock_change_map.reduceRegion.return_value.getInfo.return_value = {
+        mock_change_map = make_change_map({
             "class_1": 1000,
             "class_2": 2000,
             "class_3": 5000,
             "class_4": 1500,
             "class_5": 500
-        }
+        })
+        mock_aoi = sentinel.aoi
 
         result = generate_change_statistics(
             change_map=mock_change_map,
@@ -150,17 +155,13 @@ class TestChangeStatistics:
         total = sum(sample_statistics["percentage_by_class"].values())
         assert 99.9 <= total <= 100.1
 
-    def test_area_calculation(self, mock_ee):
+    def test_area_calculation(self, mock_ee, make_change_map):
         """Test area is calculated correctly from pixel counts."""
         from engine.change import generate_change_statistics
 
-        mock_change_map = MagicMock()
-        mock_aoi = MagicMock()
-
         # 1000 pixels at 30m resolution = 900,000 m² = 90 ha
-        mock_change_map.reduceRegion.return_value.getInfo.return_value = {
-            "class": 1000
-        }
+        mock_change_map = make_change_map({"class": 1000})
+        mock_aoi = sentinel.aoi
 
         result = generate_change_statistics(
             change_map=mock_change_map,
@@ -171,17 +172,76 @@ class TestChangeStatistics:
         # Verify area calculation is reasonable
         assert result is not None
 
+    def test_batched_statistics_one_entry_per_comparison(self, mock_ee, make_mock):
+        """Test batched statistics are keyed by comparison name."""
+        from engine.change import generate_batched_change_statistics
+
+        changes = {
+            "1990s_to_2000s": make_mock("1990s_to_2000s"),
+            "1990s_to_present": make_mock("1990s_to_present"),
+        }
+
+        result = generate_batched_change_statistics(changes, sentinel.aoi, scale=30)
+
+        assert set(result) == set(changes)
+
+    def test_batched_statistics_empty_input(self, mock_ee):
+        """Test batched statistics with no comparisons."""
+        from engine.change import generate_batched_change_statistics
+
+        assert generate_batched_change_statistics({}, sentinel.aoi) == {}
+
+    def test_summarize_change_merges_grouped_areas(self, mock_ee, make_mock):
+        """Test the summary carries per-class areas from one grouped reduction."""
+        from engine.change import summarize_change
+
+        change_map = make_mock("change_map")
+        reduced = change_map.select.return_value.addBands.return_value.reduceRegion.return_value
+        reduced.getInfo.return_value = {
+            "groups": [{"class": 1, "sum": 30000.0}, {"class": 3, "sum": 90000.0}]
+        }
+
+        summary = summarize_change(change_map, sentinel.aoi, scale=30)
+
+        assert [row["class"] for row in summary] == [1, 2, 3, 4, 5]
+        assert summary[0]["area_ha"] == pytest.approx(3.0)
+        assert summary[1]["area_ha"] == 0
+        assert summary[2]["percentage"] == pytest.approx(75.0)
+        assert reduced.getInfo.call_count == 1
+
+    def test_summarize_class_histogram(self, mock_ee):
+        """Test histogram counts convert to hectares and percentages."""
+        from engine.change import summarize_class_histogram
+
+        # 1000 pixels at 30m resolution = 900,000 m² = 90 ha
+        summary = summarize_class_histogram({"1": 1000, "3": 3000}, scale=30)
+
+        assert summary["total_pixels"] == 4000
+        assert summary["area_by_class"]["Strong Loss"] == pytest.approx(90.0)
+        assert summary["area_by_class"]["Strong Gain"] == 0.0
+        assert summary["percentage_by_class"]["Stable"] == pytest.approx(75.0)
+        assert sum(summary["percentage_by_class"].values()) == pytest.approx(100.0)
+
+    def test_summarize_empty_histogram(self, mock_ee):
+        """Test empty histogram yields zero areas."""
+        from engine.change import summarize_class_histogram
+
+        summary = summarize_class_histogram({})
+
+        assert summary["total_area_ha"] == 0.0
+        assert set(summary["percentage_by_class"].values()) == {0.0}
+
 
 class TestPeriodChangeAnalysis:
     """Tests for multi-period change analysis."""
 
-    def test_analyze_period_change(self, mock_ee):
+    def test_analyze_period_change(self, mock_ee, make_mock):
         """Test analyzing change between two periods."""
         from engine.change import analyze_period_change
 
-        mock_before = MagicMock()
-        mock_after = MagicMock()
-        mock_aoi = MagicMock()
+        mock_before = make_mock("before")
+        mock_after = make_mock("after")
+        mock_aoi = sentinel.aoi
 
         result = analyze_period_change(
             composite_before=mock_before,
@@ -192,16 +252,35 @@ class TestPeriodChangeAnalysis:
 
         assert result is not None
 
-    def test_create_change_analysis_all_periods(self, mock_ee):
+    def test_analyze_period_change_multi(self, mock_ee, make_mock):
+        """Test multi-index change subtracts all index bands in one step."""
+        from engine.change import analyze_period_change_multi
+
+        mock_before = make_mock("before")
+        mock_after = make_mock("after")
+
+        result = analyze_period_change_multi(mock_before, mock_after, ["ndvi", "nbr"])
+
+        mock_after.select.assert_called_once_with(["ndvi", "nbr"])
+        mock_before.select.assert_called_once_with(["ndvi", "nbr"])
+        mock_after.select.return_value.subtract.return_value.rename.assert_called_once_with(
+            ["dndvi", "dnbr"]
+        )
+        assert result is mock_ee.Image.cat.return_value
+
+    @pytest.fixture
+    def mock_composites(self, make_mock):
+        """One pooled composite mock per temporal period."""
+        return {
+            period: make_mock(period)
+            for period in ("1990s", "2000s", "2010s", "present")
+        }
+
+    def test_create_change_analysis_all_periods(self, mock_ee, mock_composites):
         """Test creating change analysis for all period pairs."""
         from engine.change import create_change_analysis
 
-        mock_composites = {
-            "1990s": MagicMock(),
-            "2000s": MagicMock(),
-            "present": MagicMock()
-        }
-        mock_aoi = MagicMock()
+        mock_aoi = sentinel.aoi
 
         result = create_change_analysis(
             composites=mock_composites,
@@ -212,82 +291,61 @@ class TestPeriodChangeAnalysis:
 
         assert isinstance(result, dict)
 
-    def test_reference_period_comparison(self, mock_ee):
+    @pytest.mark.parametrize(
+        "reference_period",
+        [
+            pytest.param("1990s", id="baseline_1990s"),
+            pytest.param("2010s", id="baseline_2010s"),
+        ],
+    )
+    def test_reference_period_comparison(
+        self, mock_ee, make_mock, mock_composites, reference_period
+    ):
         """Test all periods are compared to reference period."""
         from engine.change import create_change_analysis
 
-        mock_composites = {
-            "1990s": MagicMock(),
-            "2000s": MagicMock(),
-            "2010s": MagicMock(),
-            "present": MagicMock()
-        }
-        mock_aoi = MagicMock()
+        mock_aoi = sentinel.aoi
 
         result = create_change_analysis(
             composites=mock_composites,
             aoi=mock_aoi,
-            reference_period="1990s",
+            reference_period=reference_period,
             indices=["ndvi"]
         )
 
-        # Should have comparisons: 1990s->2000s, 1990s->2010s, 1990s->present
-        expected_comparisons = 3
+        # Every other period is compared to the reference, e.g. for 1990s:
+        # 1990s->2000s, 1990s->2010s, 1990s->present
+        expected_comparisons = len(mock_composites) - 1
         assert len(result) >= expected_comparisons or result is not None
 
 
 class TestChangeDetectionEdgeCases:
     """Tests for edge cases in change detection."""
 
-    def test_no_change_classified_as_stable(self, mock_ee):
-        """Test zero delta is classified as stable (class 3)."""
-        from engine.change import classify_change
-
-        mock_delta = MagicMock()
-
-        result = classify_change(
-            delta_image=mock_delta,
-            index="ndvi"
-        )
-
-        # Class 3 should be stable
-        assert result is not None
-
-    def test_extreme_negative_is_strong_loss(self, mock_ee):
-        """Test large negative delta is strong loss (class 1)."""
-        from engine.change import classify_change
+    @pytest.mark.parametrize("delta,expected_class", [
+        pytest.param(0.0, 3, id="no_change_classified_as_stable"),
+        pytest.param(-1.0, 1, id="extreme_negative_is_strong_loss"),
+        pytest.param(1.0, 5, id="extreme_positive_is_strong_gain"),
+    ])
+    def test_classification_edge_cases(self, mock_ee, make_mock, delta, expected_class):
+        """Test the classification expression maps extreme deltas to the end classes."""
+        from engine.change.thresholds import ChangeThresholds, ThresholdClassifier
 
-        mock_delta = MagicMock()
+        mock_delta = make_mock("delta")
 
-        result = classify_change(
-            delta_image=mock_delta,
-            index="ndvi"
-        )
+        ThresholdClassifier(ChangeThresholds.from_config("ndvi")).classify(mock_delta)
 
-        assert result is not None
+        # Evaluate the per-pixel expression for a single delta value
+        expression, params = mock_delta.expression.call_args.args
+        assert eval(expression, {"b": lambda _: delta}, dict(params)) == expected_class
 
-    def test_extreme_positive_is_strong_gain(self, mock_ee):
-        """Test large positive delta is strong gain (class 5)."""
-        from engine.change import classify_change
-
-        mock_delta = MagicMock()
-
-        result = classify_change(
-            delta_image=mock_delta,
-            index="ndvi"
-        )
-
-        assert result is not None
-
-    def test_empty_region_handling(self, mock_ee):
+    def test_empty_region_handling(self, mock_ee, make_change_map):
         """Test handling of empty region (no data)."""
         from engine.change import generate_change_statistics
 
-        mock_change_map = MagicMock()
-        mock_aoi = MagicMock()
-
         # Mock empty result
-        mock_change_map.reduceRegion.return_value.getInfo.return_value = {}
+        mock_change_map = make_change_map({})
+        mock_aoi = sentinel.aoi
 
         result = generate_change_statistics(
             change_map=mock_change_map,
@@ -9,41 +9,56 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import MagicMock, Mock, patch
+from collections.abc import Mapping
+from unittest.mock import MagicMock, Mock, patch, sentinel
 
 
 class TestCloudMasking:
     """Tests for cloud masking functions."""
 
-    def test_landsat_cloud_mask_uses_qa_band(self, mock_ee):
+    def test_landsat_cloud_mask_uses_qa_band(self, mock_ee, make_mock):
         """Test Landsat cloud masking uses QA_PIXEL band."""
         from engine.composites import apply_cloud_mask_landsat
 
-        mock_image = MagicMock()
+        mock_image = make_mock("image")
 
         result = apply_cloud_mask_landsat(mock_image)
 
         # Should select QA_PIXEL band
-        select_calls = [str(call) for call in mock_image.select.call_args_list]
-        assert any("QA" in str(call).upper() for call in select_calls) or result is not None
+        assert any(
+            "QA" in str(call.args[0] if call.args else "").upper()
+            for call in mock_image.select.call_args_list
+        ) or result is not None
 
-    def test_sentinel2_cloud_mask_uses_qa60(self, mock_ee):
+    def test_landsat_cloud_mask_single_bitmask(self, mock_ee, make_mock):
+        """Test Landsat flags are tested with one combined bitmask."""
+        from engine.composites import apply_cloud_mask_landsat
+
+        mock_image = make_mock("image")
+        qa = mock_image.select.return_value
+
+        apply_cloud_mask_landsat(mock_image)
+
+        # Dilated cloud (1), cloud (3), shadow (4) and snow (5)
+        qa.bitwiseAnd.assert_called_once_with(0b111010)
+
+    def test_sentinel2_cloud_mask_uses_qa60(self, mock_ee, make_mock):
         """Test Sentinel-2 cloud masking uses QA60 band."""
         from engine.composites import apply_cloud_mask_sentinel2
 
-        mock_image = MagicMock()
+        mock_image = make_mock("image")
 
         result = apply_cloud_mask_sentinel2(mock_image)
 
         # Should use QA60 for cloud detection
         assert result is not None
 
-    def test_cloud_mask_returns_masked_image(self, mock_ee):
+    def test_cloud_mask_returns_masked_image(self, mock_ee, make_mock):
         """Test cloud mask returns image with mask applied."""
         from engine.composites import apply_cloud_mask_landsat
 
-        mock_image = MagicMock()
-        mock_masked = MagicMock()
+        mock_image = make_mock("image")
+        mock_masked = make_mock("masked")
         mock_image.updateMask.return_value = mock_masked
 
         result = apply_cloud_mask_landsat(mock_image)
@@ -55,11 +70,11 @@ class TestCloudMasking:
 class TestBandHarmonization:
     """Tests for band name harmonization."""
 
-    def test_harmonize_landsat8_bands(self, mock_ee):
+    def test_harmonize_landsat8_bands(self, mock_ee, make_mock):
         """Test Landsat 8 band harmonization."""
         from engine.composites import harmonize_bands
 
-        mock_image = MagicMock()
+        mock_image = make_mock("image")
         mock_image.get.return_value.getInfo.return_value = "LANDSAT/LC08/C02/T1_L2"
 
         result = harmonize_bands(mock_image, sensor="landsat8")
@@ -67,11 +82,11 @@ class TestBandHarmonization:
         # Should rename bands to standard names
         assert result is not None
 
-    def test_harmonize_sentinel2_bands(self, mock_ee):
+    def test_harmonize_sentinel2_bands(self, mock_ee, make_mock):
         """Test Sentinel-2 band harmonization."""
         from engine.composites import harmonize_bands
 
-        mock_image = MagicMock()
+        mock_image = make_mock("image")
 
         result = harmonize_bands(mock_image, sensor="sentinel2")
 
@@ -94,7 +109,7 @@ class TestTemporalComposites:
         """Test composite creation filters by date range."""
         from engine.composites import create_landsat_composite
 
-        mock_aoi = MagicMock()
+        mock_aoi = sentinel.aoi
 
         result = create_landsat_composite(
             aoi=mock_aoi,
@@ -110,7 +125,7 @@ class TestTemporalComposites:
         """Test composite creation filters by cloud cover."""
         from engine.composites import create_landsat_composite
 
-        mock_aoi = MagicMock()
+        mock_aoi = sentinel.aoi
 
         result = create_landsat_composite(
             aoi=mock_aoi,
@@ -122,12 +137,28 @@ class TestTemporalComposites:
 
         assert result is not None
 
-    def test_create_composite_uses_median(self, mock_ee):
+    def test_create_landsat_composite_single_combined_filter(self, mock_ee):
+        """Test bounds, date and cloud filters are applied as one ee.Filter.And."""
+        from engine.composites import create_landsat_composite
+
+        create_landsat_composite(
+            aoi=sentinel.aoi,
+            start_date="2023-01-01",
+            end_date="2023-12-31",
+            sensor="LANDSAT/LC08/C02/T1_L2"
+        )
+
+        collection = mock_ee.ImageCollection.return_value
+        collection.filter.assert_called_once_with(mock_ee.Filter.And.return_value)
+        mock_ee.Filter.bounds.assert_called_once_with(sentinel.aoi)
+        assert not collection.filterBounds.called
+
+    def test_create_composite_uses_median(self, mock_ee, make_mock):
         """Test composite uses median reducer."""
         from engine.composites import create_landsat_composite
 
-        mock_aoi = MagicMock()
-        mock_collection = MagicMock()
+        mock_aoi = sentinel.aoi
+        mock_collection = make_mock("collection")
         mock_ee.ImageCollection.return_value = mock_collection
 
         result = create_landsat_composite(
@@ -144,7 +175,7 @@ class TestTemporalComposites:
         """Test Sentinel-2 composite creation."""
         from engine.composites import create_sentinel_composite
 
-        mock_aoi = MagicMock()
+        mock_aoi = sentinel.aoi
 
         result = create_sentinel_composite(
             aoi=mock_aoi,
@@ -162,7 +193,7 @@ class TestMultiSensorFusion:
         """Test fused composite combines multiple sensors."""
         from engine.composites import create_fused_composite
 
-        mock_aoi = MagicMock()
+        mock_aoi = sentinel.aoi
 
         result = create_fused_composite(
             aoi=mock_aoi,
@@ -173,11 +204,25 @@ class TestMultiSensorFusion:
 
         assert result is not None
 
+    def test_fused_composite_flattens_once(self, mock_ee):
+        """Test multi-sensor collections are merged by one flatten, not chained merges."""
+        from engine.composites import create_fused_composite
+
+        create_fused_composite(
+            aoi=sentinel.aoi,
+            start_date="2023-01-01",
+            end_date="2023-12-31",
+            sensors=["LANDSAT/LC08/C02/T1_L2", "COPERNICUS/S2_SR_HARMONIZED"]
+        )
+
+        mock_ee.FeatureCollection.return_value.flatten.assert_called_once_with()
+        assert not mock_ee.ImageCollection.return_value.merge.called
+
     def test_fused_composite_harmonizes_bands(self, mock_ee):
         """Test fused composite has harmonized bands from all sensors."""
         from engine.composites import create_fused_composite
 
-        mock_aoi = MagicMock()
+        mock_aoi = sentinel.aoi
 
         result = create_fused_composite(
             aoi=mock_aoi,
@@ -197,7 +242,7 @@ class TestPeriodComposites:
         """Test creating composites for all periods."""
         from engine.composites import create_all_period_composites
 
-        mock_aoi = MagicMock()
+        mock_aoi = sentinel.aoi
         periods = ["1990s", "present"]
 
         result = create_all_period_composites(
@@ -205,7 +250,26 @@ class TestPeriodComposites:
             periods=periods
         )
 
-        assert isinstance(result, dict)
+        assert isinstance(result, Mapping)
+        assert dict(result) == {period: result[period] for period in periods}
+
+    def test_period_composites_built_on_access(self, mock_ee):
+        """Test a period composite is only built when it is read."""
+        from engine.composites import create_all_period_composites
+
+        with patch("engine.composites.temporal.create_fused_composite") as mock_fused:
+            result = create_all_period_composites(
+                aoi=sentinel.aoi,
+                periods=["1990s", "2000s", "present"]
+            )
+
+            assert list(result) == ["1990s", "2000s", "present"]
+            assert not mock_fused.called
+
+            first = result["present"]
+
+            assert result["present"] is first
+            assert mock_fused.call_count == 1
 
     def test_period_config_validation(self, mock_ee):
         """Test period configuration is valid."""
@@ -221,7 +285,7 @@ class TestPeriodComposites:
         """Test invalid period name raises error."""
         from engine.composites import create_all_period_composites
 
-        mock_aoi = MagicMock()
+        mock_aoi = sentinel.aoi
 
         with pytest.raises((KeyError, ValueError)):
             create_all_period_composites(
@@ -233,22 +297,22 @@ class TestPeriodComposites:
 class TestScaleFactors:
     """Tests for reflectance scale factor application."""
 
-    def test_landsat_scale_factors(self, mock_ee):
+    def test_landsat_scale_factors(self, mock_ee, make_mock):
         """Test Landsat scale factors are applied correctly."""
         from engine.composites import apply_scale_factors
 
-        mock_image = MagicMock()
+        mock_image = make_mock("image")
 
         result = apply_scale_factors(mock_image, sensor="landsat8")
 
         # Should multiply by scale factor
         assert mock_image.multiply.called or result is not None
 
-    def test_sentinel2_scale_factors(self, mock_ee):
+    def test_sentinel2_scale_factors(self, mock_ee, make_mock):
         """Test Sentinel-2 scale factors are applied correctly."""
         from engine.composites import apply_scale_factors
 
-        mock_image = MagicMock()
+        mock_image = make_mock("image")
 
         result = apply_scale_factors(mock_image, sensor="sentinel2")
 
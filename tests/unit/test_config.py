@@ -10,6 +10,38 @@ Tests cover:
 
 import pytest
 from datetime import datetime
+from functools import lru_cache
+
+
+def _fast_date(value: str) -> datetime:
+    """Parse a fixed-width ``YYYY-MM-DD`` string without strptime."""
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(f"Not a YYYY-MM-DD date: {value!r}")
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+
+@lru_cache(maxsize=None)
+def _period_dates():
+    """Parse every period's start/end dates once per session."""
+    from engine.config import TEMPORAL_PERIODS
+
+    return {
+        name: (_fast_date(config["start"]), _fast_date(config["end"]))
+        for name, config in TEMPORAL_PERIODS.items()
+    }
+
+
+# Parametrize over literal keys: importing engine.config at collection time
+# would bind ee before mock_ee can patch it.
+PERIOD_NAMES = ["1990s", "2000s", "2010s", "present"]
+SENSOR_COLLECTIONS = [
+    "LANDSAT/LT05/C02/T1_L2",
+    "LANDSAT/LE07/C02/T1_L2",
+    "LANDSAT/LC08/C02/T1_L2",
+    "COPERNICUS/S2_SR_HARMONIZED",
+]
+
+REQUIRED_INDEX_METADATA = frozenset(("full_name", "formula", "range", "description"))
 
 
 class TestTemporalPeriods:
@@ -24,25 +56,23 @@ class TestTemporalPeriods:
         for period in expected_periods:
             assert period in TEMPORAL_PERIODS, f"Missing period: {period}"
 
-    def test_period_has_required_fields(self):
+    @pytest.mark.parametrize("period_name", PERIOD_NAMES)
+    def test_period_has_required_fields(self, period_name):
         """Test each period has required configuration fields."""
         from engine.config import TEMPORAL_PERIODS
 
         required_fields = ["start", "end", "sensors", "description"]
+        config = TEMPORAL_PERIODS[period_name]
 
-        for period_name, config in TEMPORAL_PERIODS.items():
-            for field in required_fields:
-                assert field in config, f"{period_name} missing field: {field}"
+        for field in required_fields:
+            assert field in config, f"{period_name} missing field: {field}"
 
-    def test_period_dates_are_valid(self):
+    @pytest.mark.parametrize("period_name", PERIOD_NAMES)
+    def test_period_dates_are_valid(self, period_name):
         """Test period dates are in valid format."""
-        from engine.config import TEMPORAL_PERIODS
+        start, end = _period_dates()[period_name]
 
-        for period_name, config in TEMPORAL_PERIODS.items():
-            start = datetime.strptime(config["start"], "%Y-%m-%d")
-            end = datetime.strptime(config["end"], "%Y-%m-%d")
-
-            assert start < end, f"{period_name}: start must be before end"
+        assert start < end, f"{period_name}: start must be before end"
 
     def test_periods_cover_sensor_availability(self):
         """Test periods match sensor availability."""
@@ -56,16 +86,12 @@ class TestTemporalPeriods:
 
     def test_periods_are_chronological(self):
         """Test periods don't overlap unexpectedly."""
-        from engine.config import TEMPORAL_PERIODS
-
+        dates = _period_dates()
         period_order = ["1990s", "2000s", "2010s", "present"]
 
         for i in range(len(period_order) - 1):
-            current = TEMPORAL_PERIODS[period_order[i]]
-            next_period = TEMPORAL_PERIODS[period_order[i + 1]]
-
-            current_end = datetime.strptime(current["end"], "%Y-%m-%d")
-            next_start = datetime.strptime(next_period["start"], "%Y-%m-%d")
+            current_end = dates[period_order[i]][1]
+            next_start = dates[period_order[i + 1]][0]
 
             # Next period should start after or at current period end
             assert next_start >= current_end or (next_start.year - current_end.year) <= 1
@@ -83,23 +109,37 @@ class TestBandMappings:
         for sensor in expected_sensors:
             assert sensor in BAND_MAPPINGS, f"Missing mapping: {sensor}"
 
-    def test_standard_bands_mapped(self):
+    @pytest.mark.parametrize("sensor", SENSOR_COLLECTIONS)
+    def test_standard_bands_mapped(self, sensor):
         """Test standard band names are mapped for each sensor."""
         from engine.config import BAND_MAPPINGS
 
         standard_bands = ["blue", "green", "red", "nir", "swir1", "swir2"]
+        mapping = BAND_MAPPINGS[sensor]
 
-        for sensor, mapping in BAND_MAPPINGS.items():
-            if "bands" in mapping:
-                for band in standard_bands:
-                    assert band in mapping["bands"], f"{sensor} missing band: {band}"
+        if "bands" in mapping:
+            for band in standard_bands:
+                assert band in mapping["bands"], f"{sensor} missing band: {band}"
 
-    def test_scale_factors_defined(self):
+    @pytest.mark.parametrize("sensor", SENSOR_COLLECTIONS)
+    def test_scale_factors_defined(self, sensor):
         """Test scale factors are defined for sensors."""
         from engine.config import BAND_MAPPINGS
 
-        for sensor, mapping in BAND_MAPPINGS.items():
-            assert "scale_factor" in mapping or "offset" in mapping or True  # Optional
+        mapping = BAND_MAPPINGS[sensor]
+        assert "scale_factor" in mapping or "offset" in mapping or True  # Optional
+
+    def test_get_band_mapping_lookup(self):
+        """Test band mapping lookup returns the config entry and rejects unknown sensors."""
+        from engine.config import BAND_MAPPINGS, get_band_mapping
+
+        sensor = SENSOR_COLLECTIONS[0]
+
+        assert get_band_mapping(sensor) is BAND_MAPPINGS[sensor]
+        assert get_band_mapping(sensor) is get_band_mapping(sensor)
+
+        with pytest.raises(ValueError):
+            get_band_mapping("UNKNOWN/SENSOR")
 
 
 class TestChangeThresholds:
@@ -129,12 +169,16 @@ class TestChangeThresholds:
         from engine.config import CHANGE_THRESHOLDS
 
         for index, thresholds in CHANGE_THRESHOLDS.items():
-            # Strong loss and gain should be roughly symmetric
-            loss_magnitude = abs(thresholds["strong_loss"])
+            # Strong loss and gain should be roughly symmetric;
+            # strong_loss is known negative, so negate instead of abs()
+            loss_magnitude = -thresholds["strong_loss"]
             gain_magnitude = thresholds["strong_gain"]
 
             # Within 50% of each other
-            ratio = max(loss_magnitude, gain_magnitude) / min(loss_magnitude, gain_magnitude)
+            if loss_magnitude > gain_magnitude:
+                ratio = loss_magnitude / gain_magnitude
+            else:
+                ratio = gain_magnitude / loss_magnitude
             assert ratio < 2.0, f"{index} thresholds not symmetric"
 
 
@@ -184,6 +228,19 @@ class TestVegChangeConfig:
 
         assert config is not None
 
+    def test_config_is_frozen_and_hashable(self):
+        """Test VegChangeConfig is immutable and usable as a dict key."""
+        import dataclasses
+        from engine.config import VegChangeConfig
+
+        config = VegChangeConfig(region="Amazonas")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.region = "Other"
+
+        assert hash(config) == hash(VegChangeConfig(region="Amazonas"))
+        assert {config: 1}[VegChangeConfig(region="Amazonas")] == 1
+
     def test_config_validation(self):
         """Test config validation catches invalid values."""
         from engine.config import VegChangeConfig
@@ -226,11 +283,10 @@ class TestIndexConfig:
         """Test index metadata is complete."""
         from engine.config import INDEX_METADATA
 
-        required_fields = ["full_name", "formula", "range", "description"]
-
         for index_name, metadata in INDEX_METADATA.items():
-            for field in required_fields:
-                assert field in metadata, f"{index_name} missing: {field}"
+            assert REQUIRED_INDEX_METADATA.issubset(metadata), (
+                f"{index_name} missing: {sorted(REQUIRED_INDEX_METADATA - metadata.keys())}"
+            )
 
     def test_index_formulas_are_documented(self):
         """Test all index formulas are documented."""
@@ -239,3 +295,14 @@ class TestIndexConfig:
         for index_name, metadata in INDEX_METADATA.items():
             formula = metadata.get("formula", "")
             assert len(formula) > 0, f"{index_name} has no formula"
+
+
+class TestParametrizeKeys:
+    """Tests that the literal parametrize lists track the config."""
+
+    def test_literal_keys_match_config(self):
+        """Test PERIOD_NAMES and SENSOR_COLLECTIONS cover every config entry."""
+        from engine.config import BAND_MAPPINGS, TEMPORAL_PERIODS
+
+        assert set(PERIOD_NAMES) == set(TEMPORAL_PERIODS)
+        assert set(SENSOR_COLLECTIONS) == set(BAND_MAPPINGS)
@@ -53,6 +53,70 @@ class TestAOILoaders:
         result = load_aoi(str(filepath))
         assert len(result) == 1
 
+    def test_load_geojson_seq(self, tmp_path):
+        """Test loading newline-delimited GeoJSON."""
+        from engine.io.aoi import load_aoi
+
+        features = [
+            {
+                "type": "Feature",
+                "properties": {"name": f"parcel_{i}"},
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[
+                        [i, 0], [i + 1, 0], [i + 1, 1], [i, 1], [i, 0]
+                    ]]
+                }
+            }
+            for i in range(3)
+        ]
+
+        filepath = tmp_path / "parcels.geojsonl"
+        filepath.write_text("\n".join(json.dumps(f) for f in features) + "\n")
+
+        result = load_aoi(str(filepath))
+        assert len(result) == 3
+        assert list(result["name"]) == ["parcel_0", "parcel_1", "parcel_2"]
+
+    def test_load_with_cache_writes_flatgeobuf(self, temp_geojson_file):
+        """Test cached load writes a FlatGeobuf sibling and reuses it."""
+        from engine.io.aoi import load_aoi
+
+        first = load_aoi(str(temp_geojson_file), cache=True)
+        cache_path = Path(f"{temp_geojson_file}.cache.fgb")
+        assert cache_path.exists()
+
+        second = load_aoi(str(temp_geojson_file), cache=True)
+        assert len(second) == len(first)
+
+    def test_load_with_cache_keeps_sources_with_same_stem_apart(
+        self, tmp_path, sample_aoi_geojson
+    ):
+        """Test sources sharing a stem do not read each other's cache."""
+        from engine.io.aoi import load_aoi
+
+        geojson_path = tmp_path / "aoi.geojson"
+        geojson_path.write_text(json.dumps(sample_aoi_geojson))
+        seq_path = tmp_path / "aoi.geojsonl"
+        seq_path.write_text("\n".join(json.dumps(sample_aoi_geojson) for _ in range(3)))
+
+        assert len(load_aoi(str(geojson_path), cache=True)) == 1
+        assert len(load_aoi(str(seq_path), cache=True)) == 3
+        assert len(load_aoi(str(geojson_path), cache=True)) == 1
+
+    def test_load_with_cache_leaves_existing_flatgeobuf(self, tmp_path, sample_aoi_geojson):
+        """Test a user's own aoi.fgb next to the source is not overwritten."""
+        from engine.io.aoi import load_aoi
+
+        geojson_path = tmp_path / "aoi.geojson"
+        geojson_path.write_text(json.dumps(sample_aoi_geojson))
+        user_fgb = tmp_path / "aoi.fgb"
+        user_fgb.write_bytes(b"user data")
+
+        load_aoi(str(geojson_path), cache=True)
+
+        assert user_fgb.read_bytes() == b"user data"
+
     def test_load_nonexistent_file_raises_error(self):
         """Test loading nonexistent file raises FileNotFoundError."""
         from engine.io.aoi import load_aoi
@@ -160,6 +224,14 @@ class TestAOIMetadata:
 
         assert area > 0
 
+    def test_get_aoi_area_assume_disjoint(self, temp_geojson_file):
+        """Test summed area matches dissolved area for a single feature."""
+        from engine.io.aoi import load_aoi, get_aoi_area
+
+        gdf = load_aoi(str(temp_geojson_file))
+
+        assert get_aoi_area(gdf, assume_disjoint=True) == pytest.approx(get_aoi_area(gdf))
+
 
 class TestExporters:
     """Tests for export functions."""
@@ -236,6 +308,19 @@ class TestExporters:
 
         assert task is not None
 
+    def test_export_all_changes_starts_every_task(self, mock_ee):
+        """Test batch export starts one task per comparison, keyed by name."""
+        from engine.io.exporters import export_all_changes
+
+        changes = {"1990s_to_2000s": MagicMock(), "1990s_to_present": MagicMock()}
+
+        with patch("engine.io.exporters.export_to_drive") as mock_export:
+            tasks = export_all_changes(changes, region=MagicMock())
+
+        assert set(tasks) == set(changes)
+        assert all(call.kwargs["start"] is False for call in mock_export.call_args_list)
+        assert mock_export.return_value.start.call_count == len(changes)
+
 
 class TestTileURLs:
     """Tests for tile URL generation."""
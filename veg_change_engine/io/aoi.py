@@ -13,6 +13,8 @@ from engine.io.aoi import (
     GeoPackageLoader,
     ShapefileLoader,
     GeoJSONLoader,
+    GeoJSONSeqLoader,
+    FlatGeobufLoader,
     KMZLoader,
     KMLLoader,
     LOADER_REGISTRY,
@@ -37,6 +39,8 @@ __all__ = [
     "GeoPackageLoader",
     "ShapefileLoader",
     "GeoJSONLoader",
+    "GeoJSONSeqLoader",
+    "FlatGeobufLoader",
     "KMZLoader",
     "KMLLoader",
     "LOADER_REGISTRY",